@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark dan profiling untuk jalur panas blackjack.py
+Mengukur ops/detik, alokasi memori (tracemalloc) dan cProfile top-N, lalu
+bisa menyimpan hasilnya sebagai baseline JSON untuk dibandingkan antar commit.
+
+Contoh:
+    python bench_blackjack.py --save baseline.json
+    python bench_blackjack.py --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from blackjack import BlackJack, Deck, Hand
+from blackjack_sim import StandOn, deal_hands, play_hand
+
+
+def bench_shuffle(n, rng):
+    deck = Deck(rng)
+    for _ in range(n):
+        deck.shuffle()
+
+
+def bench_draw_card(n, rng):
+    deck = Deck(rng)
+    for _ in range(n):
+        deck.draw_card()
+
+
+def bench_draw_card_limited(n, rng):
+    deck = Deck(rng)
+    for i in range(n):
+        # Dek di-reset berkala agar tidak terus bertambah besar
+        if i % 20 == 0:
+            deck.reset()
+        deck.draw_card_limited()
+
+
+def bench_hand_get_value(n, rng):
+    hand = Hand()
+    for code in (0, 12, 4):
+        hand.add_card(code)
+    for _ in range(n):
+        hand.get_value()
+
+
+def bench_deal_initial_cards(n, rng):
+    game = BlackJack(50)
+    game.deck = Deck(rng)
+    # Output permainan dibuang agar yang terukur hanya pembagian + print
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(n):
+            game.deck.reset()
+            game.deal_initial_cards()
+
+
+def bench_deal_hands(n, rng):
+    deck = Deck(rng)
+    for _ in range(n):
+        deck.reset()
+        deal_hands(deck)
+
+
+def bench_full_round(n, rng):
+    deck = Deck(rng)
+    policy = StandOn(17)
+    for _ in range(n):
+        deck.reset()
+        play_hand(deck, policy)
+
+
+def _mid_round_game(rng):
+    game = BlackJack(50)
+    game.deck = Deck(rng)
+    game.player_hand, game.dealer_hand = deal_hands(game.deck)
+    return game
+
+
+def bench_snapshot_restore(n, rng):
+    game = _mid_round_game(rng)
+    snapshot = game.snapshot()
+    for _ in range(n):
+        game.restore(snapshot, restore_rng=False)
+
+
+def bench_fork(n, rng):
+    game = _mid_round_game(rng)
+    for _ in range(n):
+        game.fork()
+
+
+BENCHMARKS = {
+    "Deck.shuffle": bench_shuffle,
+    "Deck.draw_card": bench_draw_card,
+    "Deck.draw_card_limited": bench_draw_card_limited,
+    "Hand.get_value": bench_hand_get_value,
+    "BlackJack.deal_initial_cards": bench_deal_initial_cards,
+    "deal_hands": bench_deal_hands,
+    "ronde_headless": bench_full_round,
+    "BlackJack.snapshot+restore": bench_snapshot_restore,
+    "BlackJack.fork": bench_fork,
+}
+
+
+def measure(func, min_time=0.2, repeat=5):
+    """Ops/detik terbaik dari beberapa pengulangan (n dinaikkan sampai >= min_time)"""
+    n = 100
+    while True:
+        start = time.perf_counter()
+        func(n, random.Random(0))
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        n *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed
+    for seed in range(1, repeat):
+        start = time.perf_counter()
+        func(n, random.Random(seed))
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def measure_memory(func, n=10000):
+    """(puncak byte, byte per operasi yang masih tersisa) selama n operasi"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func(n, random.Random(0))
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - before, (after - before) / n
+
+
+def profile(func, n, top):
+    """cProfile top-N (berdasarkan tottime) sebagai teks"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    func(n, random.Random(0))
+    profiler.disable()
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats("tottime").print_stats(top)
+    return output.getvalue()
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Mencetak perubahan terhadap baseline; True jika ada regresi"""
+    regression = False
+    print(f"\nPERBANDINGAN DENGAN BASELINE (commit {baseline.get('commit')})")
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"  {name:<30} (baru)")
+            continue
+        change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+        mark = ""
+        if change < -threshold:
+            mark = "  ⚠️  REGRESI"
+            regression = True
+        print(f"  {name:<30} {change:+8.1%}{mark}")
+    return regression
+
+
+def main():
+    """Fungsi utama untuk menjalankan benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark blackjack.py")
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS), help="jalankan sebagian saja")
+    parser.add_argument("--save", metavar="FILE", help="simpan hasil sebagai baseline JSON")
+    parser.add_argument("--compare", metavar="FILE", help="bandingkan dengan baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="batas regresi (default 0.10)")
+    parser.add_argument("--top", type=int, default=15, help="jumlah baris cProfile")
+    parser.add_argument("--no-profile", action="store_true", help="lewati cProfile")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    results = {}
+    print(f"{'BENCHMARK':<30} {'ops/detik':>14} {'puncak mem':>12} {'sisa/op':>10}")
+    for name in names:
+        ops = measure(BENCHMARKS[name])
+        peak, retained = measure_memory(BENCHMARKS[name])
+        results[name] = {"ops_per_sec": ops, "peak_bytes": peak, "retained_bytes_per_op": retained}
+        print(f"{name:<30} {ops:>14,.0f} {peak / 1024:>9.1f} KiB {retained:>8.1f} B")
+
+    if not args.no_profile:
+        print("\nCPROFILE: ronde_headless (20000 ronde)")
+        print(profile(bench_full_round, 20000, args.top))
+
+    data = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        print(f"✓ Baseline disimpan ke {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
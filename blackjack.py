@@ -1,120 +1,260 @@
 import random
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+RANKS = ['Ace', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King']
+
+# Kartu disimpan sebagai angka kecil 0-51: kode = indeks_suit * 13 + indeks_rank
+# Tabel di bawah dihitung sekali agar nilai kartu cukup diambil lewat indeks
+RANK_VALUES = [11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10]
+CARD_VALUES = bytes(RANK_VALUES[code % 13] for code in range(52))
+CARD_IS_ACE = bytes(1 if code % 13 == 0 else 0 for code in range(52))
+# Nilai terendah tiap kartu (Ace = 1), dipakai sebagai bucket di dalam Deck
+CARD_LOW_VALUES = bytes(CARD_VALUES[code] - 10 * CARD_IS_ACE[code] for code in range(52))
+FULL_DECK = array('B', range(52))
+
+
+@lru_cache(maxsize=None)
+def opening_pairs(low, high):
+    """Daftar pasangan nilai bucket (v1, v2) yang jika dipegang bernilai low-high"""
+    pairs = []
+    for v1 in range(1, 11):
+        for v2 in range(1, 11):
+            total = (11 if v1 == 1 else v1) + (11 if v2 == 1 else v2)
+            if total > 21:
+                total -= 10  # dua Ace: salah satunya bernilai 1
+            if low <= total <= high:
+                pairs.append((v1, v2))
+    return tuple(pairs)
+
+
+def card_code(suit, rank):
+    """Mengubah suit dan rank menjadi kode kartu"""
+    return SUITS.index(suit) * 13 + RANKS.index(rank)
+
 
 class Card:
-    """Kelas untuk merepresentasikan satu kartu"""
+    """Kelas untuk menampilkan satu kartu (view dari kode kartu)"""
     def __init__(self, suit, rank):
         self.suit = suit
         self.rank = rank
+        self.code = card_code(suit, rank)
+    
+    @classmethod
+    def from_code(cls, code):
+        """Mengembalikan Card untuk kode kartu"""
+        return CARD_VIEWS[code]
     
     def __str__(self):
         return f"{self.rank} of {self.suit}"
     
     def get_value(self):
         """Mengembalikan nilai kartu"""
-        if self.rank in ['King', 'Queen', 'Jack']:
-            return 10
-        elif self.rank == 'Ace':
-            return 11
-        else:
-            return int(self.rank)
+        return CARD_VALUES[self.code]
+
+
+# Isi bucket Deck untuk satu dek baru (indeks = nilai terendah kartu)
+FULL_BUCKETS = tuple(
+    array('B', [code for code in FULL_DECK if CARD_LOW_VALUES[code] == value])
+    for value in range(11)
+)
+
+
+# Satu objek Card per kode, hanya dipakai untuk tampilan
+CARD_VIEWS = tuple(Card(suit, rank) for suit in SUITS for rank in RANKS)
 
 
 class Deck:
-    """Kelas untuk merepresentasikan dek kartu"""
-    def __init__(self):
-        self.cards = []
+    """Kelas untuk merepresentasikan dek kartu.
+
+    Kartu disimpan per nilai (bucket 1-10, Ace masuk bucket 1) sehingga
+    draw_card() dan draw_card_in_range() sama-sama O(1). Setiap pengambilan
+    memilih kartu secara acak, jadi dek baru tidak perlu diacak ulang.
+    """
+    def __init__(self, rng=None):
+        # rng bisa diganti dengan random.Random(seed) agar hasil bisa diulang
+        self.rng = rng if rng is not None else random
+        self.buckets = [array('B') for _ in range(11)]  # indeks 0 tidak dipakai
+        self.size = 0
         self.initialize_deck()
     
+    def __len__(self):
+        return self.size
+    
     def initialize_deck(self):
         """Inisialisasi dek dengan 52 kartu"""
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['Ace', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King']
-        
-        for suit in suits:
-            for rank in ranks:
-                self.cards.append(Card(suit, rank))
+        for bucket, cards in zip(self.buckets, FULL_BUCKETS):
+            bucket.extend(cards)
+        self.size += len(FULL_DECK)
+    
+    def reset(self):
+        """Mengembalikan dek menjadi 52 kartu baru (sama seperti Deck() baru)"""
+        self.buckets = [array('B', cards) for cards in FULL_BUCKETS]
+        self.size = len(FULL_DECK)
     
     def shuffle(self):
         """Mengacak dek"""
-        random.shuffle(self.cards)
+        for bucket in self.buckets:
+            self.rng.shuffle(bucket)
+    
+    def _take(self, value, index):
+        """Mengambil kartu ke-index dari bucket nilai (tukar dengan kartu terakhir lalu pop)"""
+        bucket = self.buckets[value]
+        code = bucket[index]
+        bucket[index] = bucket[-1]
+        bucket.pop()
+        self.size -= 1
+        return code
+    
+    def _pick(self, low, high, total):
+        """Memilih kartu acak dari bucket low..high yang berisi total kartu"""
+        index = int(self.rng.random() * total)
+        buckets = self.buckets
+        for value in range(low, high + 1):
+            count = len(buckets[value])
+            if index < count:
+                return self._take(value, index)
+            index -= count
     
     def draw_card(self):
-        """Mengambil satu kartu dari dek"""
-        if len(self.cards) == 0:
+        """Mengambil satu kartu (kode) dari dek"""
+        if self.size == 0:
+            self.initialize_deck()
+        return self._pick(1, 10, self.size)
+    
+    def draw_card_in_range(self, low, high):
+        """Mengambil kartu dengan nilai low-high (Ace bernilai 1, kartu gambar 10)"""
+        total = sum(len(self.buckets[value]) for value in range(low, high + 1))
+        
+        if total == 0:
+            # Jika tidak ada kartu dengan nilai tersebut, tambahkan dek baru
             self.initialize_deck()
-            self.shuffle()
-        return self.cards.pop()
+            total = sum(len(self.buckets[value]) for value in range(low, high + 1))
+        
+        return self._pick(low, high, total)
     
     def draw_card_limited(self):
         """Mengambil kartu dengan nilai 1-6 (Ace, 2, 3, 4, 5, 6) untuk dealer"""
-        # Filter kartu dengan nilai 1-6
-        limited_cards = [card for card in self.cards if card.get_value() in [1, 2, 3, 4, 5, 6]]
+        return self.draw_card_in_range(1, 6)
+    
+    def snapshot(self):
+        """Salinan ringkas isi dek (bytes per bucket), tanpa state RNG"""
+        return tuple(bucket.tobytes() for bucket in self.buckets)
+    
+    def restore(self, snapshot):
+        """Mengembalikan isi dek dari hasil snapshot()"""
+        self.buckets = [array('B', data) for data in snapshot]
+        self.size = sum(len(data) for data in snapshot)
+    
+    def copy(self, rng=None):
+        """Dek baru dengan isi yang sama; rng=None memakai RNG yang sama"""
+        clone = Deck.__new__(Deck)
+        clone.rng = rng if rng is not None else self.rng
+        clone.buckets = [array('B', bucket) for bucket in self.buckets]
+        clone.size = self.size
+        return clone
+    
+    def draw_opening_pair(self, low, high):
+        """Mengambil dua kartu yang nilainya low-high sekaligus.
+
+        Pasangan dipilih menurut distribusi bersyarat isi dek saat ini, sama
+        seperti membagikan ulang sampai nilainya cocok, tetapi hanya 2 kartu.
+        """
+        pairs = opening_pairs(low, high)
+        buckets = self.buckets
         
-        if len(limited_cards) == 0:
-            # Jika tidak ada kartu dengan nilai 1-6, initialize ulang dek
+        while True:
+            # Bobot kumulatif tiap pasangan = banyaknya urutan kartu yang mungkin
+            counts = [len(bucket) for bucket in buckets]
+            cumulative = []
+            total = 0
+            for v1, v2 in pairs:
+                total += counts[v1] * (counts[v2] - (v1 == v2))
+                cumulative.append(total)
+            if total > 0:
+                break
+            # Tidak ada pasangan yang cocok di dek, tambahkan dek baru
             self.initialize_deck()
-            self.shuffle()
-            limited_cards = [card for card in self.cards if card.get_value() in [1, 2, 3, 4, 5, 6]]
         
-        # Ambil kartu acak dari kartu yang terbatas
-        selected_card = random.choice(limited_cards)
-        self.cards.remove(selected_card)
-        return selected_card
+        v1, v2 = pairs[bisect_right(cumulative, int(self.rng.random() * total))]
+        first = self._take(v1, int(self.rng.random() * len(buckets[v1])))
+        second = self._take(v2, int(self.rng.random() * len(buckets[v2])))
+        return first, second
 
 
 class Hand:
     """Kelas untuk merepresentasikan tangan pemain"""
     def __init__(self):
-        self.cards = []
+        self.cards = array('B')
+        self.value = 0
+        self.soft_aces = 0  # jumlah Ace yang masih bernilai 11
     
     def add_card(self, card):
-        """Menambah kartu ke tangan"""
+        """Menambah kartu (kode atau Card) ke tangan dan memperbarui nilainya"""
+        if isinstance(card, Card):
+            card = card.code
         self.cards.append(card)
-    
-    def get_value(self):
-        """Menghitung nilai total kartu dengan mempertimbangkan Ace"""
-        total = 0
-        aces = 0
-        
-        # Hitung nilai total kartu
-        for card in self.cards:
-            total += card.get_value()
-            if card.rank == 'Ace':
-                aces += 1
+        self.value += CARD_VALUES[card]
+        self.soft_aces += CARD_IS_ACE[card]
         
         # Jika nilai lebih dari 21 dan ada Ace bernilai 11, ubah menjadi 1
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-        
-        return total
+        while self.value > 21 and self.soft_aces > 0:
+            self.value -= 10
+            self.soft_aces -= 1
+    
+    def get_value(self):
+        """Mengembalikan nilai total kartu dengan mempertimbangkan Ace"""
+        return self.value
+    
+    def is_soft(self):
+        """True jika ada Ace yang masih dihitung 11"""
+        return self.soft_aces > 0
+    
+    def snapshot(self):
+        """Salinan ringkas tangan: (bytes kartu, nilai, Ace soft)"""
+        return self.cards.tobytes(), self.value, self.soft_aces
+    
+    def restore(self, snapshot):
+        """Mengembalikan tangan dari hasil snapshot()"""
+        data, self.value, self.soft_aces = snapshot
+        self.cards = array('B', data)
+    
+    def copy(self):
+        """Tangan baru dengan kartu dan nilai yang sama"""
+        clone = Hand.__new__(Hand)
+        clone.cards = array('B', self.cards)
+        clone.value = self.value
+        clone.soft_aces = self.soft_aces
+        return clone
     
     def display_cards(self, hide_first=False):
         """Menampilkan kartu yang dipegang"""
         if hide_first and len(self.cards) > 0:
             print(f"[Kartu Tersembunyi]")
-            for card in self.cards[1:]:
-                print(f"  {card}")
+            for code in self.cards[1:]:
+                print(f"  {CARD_VIEWS[code]}")
         else:
-            for card in self.cards:
-                print(f"  {card}")
+            for code in self.cards:
+                print(f"  {CARD_VIEWS[code]}")
     
     def get_cards_str(self, hide_first=False):
         """Mengembalikan string dari kartu yang dipegang"""
         cards_str = []
         if hide_first and len(self.cards) > 0:
             cards_str.append("[Kartu Tersembunyi]")
-            for card in self.cards[1:]:
-                cards_str.append(str(card))
+            for code in self.cards[1:]:
+                cards_str.append(str(CARD_VIEWS[code]))
         else:
-            for card in self.cards:
-                cards_str.append(str(card))
+            for code in self.cards:
+                cards_str.append(str(CARD_VIEWS[code]))
         return ", ".join(cards_str)
 
 
 class BlackJack:
     """Kelas utama untuk game Black Jack"""
-    def __init__(self, wortel):
+    def __init__(self, wortel, advisor=None):
         self.deck = Deck()
         self.deck.shuffle()
         self.player_hand = Hand()
@@ -123,6 +263,36 @@ class BlackJack:
         self.player_stand = False
         self.wortel = wortel
         self.bet = 0
+        # Tabel strategi dari blackjack_solver (opsional) untuk memberi saran
+        self.advisor = advisor
+    
+    def snapshot(self):
+        """Snapshot meja di tengah ronde: dek, kedua tangan, status ronde dan state RNG"""
+        return (self.deck.snapshot(), self.player_hand.snapshot(), self.dealer_hand.snapshot(),
+                self.wortel, self.bet, self.game_over, self.player_stand,
+                self.deck.rng.getstate())
+    
+    def restore(self, snapshot, restore_rng=True):
+        """Mengembalikan meja ke snapshot(); restore_rng=False membiarkan RNG tetap berjalan"""
+        (deck, player_hand, dealer_hand, self.wortel, self.bet,
+         self.game_over, self.player_stand, rng_state) = snapshot
+        self.deck.restore(deck)
+        self.player_hand.restore(player_hand)
+        self.dealer_hand.restore(dealer_hand)
+        if restore_rng:
+            self.deck.rng.setstate(rng_state)
+    
+    def fork(self, rng=None):
+        """Salinan meja yang berdiri sendiri ("bagaimana jika...").
+
+        Dengan rng baru, cabang ini mengambil kartu yang berbeda dari meja asal.
+        """
+        clone = BlackJack.__new__(BlackJack)
+        clone.__dict__.update(self.__dict__)
+        clone.deck = self.deck.copy(rng)
+        clone.player_hand = self.player_hand.copy()
+        clone.dealer_hand = self.dealer_hand.copy()
+        return clone
     
     def place_bet(self):
         """Menghandle penempatan taruhan"""
@@ -162,24 +332,15 @@ class BlackJack:
         print(f"Taruhan saat ini: 🥕 {self.bet}")
         print("="*60)
         
-        # Bagikan kartu untuk pemain sampai dealer mendapat nilai 10-13
-        dealer_value = 0
+        # Dealer langsung mendapat 2 kartu bernilai 10-13, lalu pemain 2 kartu
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        for card in self.deck.draw_opening_pair(10, 13):
+            self.dealer_hand.add_card(card)
+        for _ in range(2):
+            self.player_hand.add_card(self.deck.draw_card())
         
-        # Loop sampai dealer mendapat nilai 10-13
-        while dealer_value < 10 or dealer_value > 131:
-            self.player_hand = Hand()
-            self.dealer_hand = Hand()
-            
-            # Bagikan 2 kartu untuk pemain dan dealer
-            for _ in range(2):
-                self.player_hand.add_card(self.deck.draw_card())
-                self.dealer_hand.add_card(self.deck.draw_card())
-            
-            dealer_value = self.dealer_hand.get_value()
-            
-            # Jika dealer tidak mendapat 10-13, ulangi
-            if dealer_value < 10 or dealer_value > 13:
-                print(f"⚠️  Dealer mendapat nilai {dealer_value}. Mengambil ulang kartu...")
+        dealer_value = self.dealer_hand.get_value()
         
         print(f"✓ Dealer mendapat nilai awal: {dealer_value}")
         self.display_game_state(hide_dealer=True)
@@ -209,6 +370,11 @@ class BlackJack:
             print("(d) Draw - Ambil kartu")
             print("(s) Stand - Selesaikan giliran")
             
+            if self.advisor is not None:
+                hit, ev_hit, ev_stand = self.advisor.advise(self.player_hand, self.dealer_hand, self.deck)
+                suggestion = "Draw" if hit else "Stand"
+                print(f"💡 Saran: {suggestion} (EV draw {ev_hit:+.3f} | EV stand {ev_stand:+.3f})")
+            
             choice = input("\nMasukkan pilihan (d/s): ").lower().strip()
             
             if choice == 'd':
@@ -336,7 +502,7 @@ class BlackJack:
         return winner
 
 
-def main():
+def main(advisor=None, history=None):
     """Fungsi utama untuk menjalankan game"""
     print("\n" + "🎰 "*20)
     print("SELAMAT DATANG DI PERMAINAN BLACK JACK")
@@ -374,12 +540,16 @@ def main():
             draws = 0
             continue
         
-        game = BlackJack(wortel)
+        game = BlackJack(wortel, advisor)
         winner = game.play()
         
         # Update wortel dari hasil permainan
         wortel = game.wortel
         
+        # Simpan ronde ke riwayat biner (opsional)
+        if history is not None:
+            history.write_round(game.bet, wortel, game.player_hand, game.dealer_hand, winner)
+        
         # Update statistik
         if winner == "player":
             player_wins += 1
@@ -414,4 +584,25 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Permainan Black Jack")
+    parser.add_argument("--advisor", nargs="?", const="", metavar="FILE",
+                        help="tampilkan saran draw/stand (opsional: file tabel dari blackjack_solver.py)")
+    parser.add_argument("--history", metavar="FILE", help="simpan riwayat tangan ke file biner .bjh")
+    args = parser.parse_args()
+    
+    advisor = None
+    if args.advisor is not None:
+        from blackjack_solver import StrategyTable
+        advisor = StrategyTable.load(args.advisor) if args.advisor else StrategyTable.build()
+    
+    history = None
+    if args.history:
+        from blackjack_history import HistoryWriter
+        history = HistoryWriter(args.history)
+    try:
+        main(advisor, history)
+    finally:
+        if history is not None:
+            history.close()
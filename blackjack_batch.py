@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Evaluator Black Jack berbasis NumPy (batch)
+Memainkan N ronde sekaligus sebagai array: urutan kartu di dek, nilai tangan
+dan jumlah Ace soft. Semua ronde berjalan bersamaan: pembagian kartu, giliran
+pemain, giliran dealer (< 17, kartu Ace-6) dan aturan determine_winner.
+
+Setiap ronde memakai dek baru, sama seperti main() di blackjack.py.
+Modul ini membutuhkan numpy (pip install numpy).
+
+Contoh:
+    python blackjack_batch.py --hands 100000000 --stand-on 17
+    python blackjack_batch.py --hands 2000000 --check
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from blackjack import CARD_IS_ACE, CARD_LOW_VALUES, CARD_VALUES, FULL_DECK, Hand
+from blackjack_sim import SimulationResult, StandOn, simulate
+
+BATCH_SIZE = 100_000
+
+VALUES = np.frombuffer(CARD_VALUES, dtype=np.uint8).astype(np.int16)
+IS_ACE = np.frombuffer(CARD_IS_ACE, dtype=np.uint8).astype(np.int16)
+LOW_VALUES = np.frombuffer(CARD_LOW_VALUES, dtype=np.uint8).astype(np.int16)
+LOW_CARDS = np.flatnonzero(LOW_VALUES <= 6)
+DECK_SIZE = len(FULL_DECK)
+SHOE_SIZE = DECK_SIZE - 2  # sisa dek setelah dua kartu dealer
+
+
+def _opening_card_pairs():
+    """Semua pasangan kartu (tersembunyi, terbuka) dealer yang bernilai 10-13"""
+    pairs = []
+    for first in FULL_DECK:
+        for second in FULL_DECK:
+            if first == second:
+                continue
+            hand = Hand()
+            hand.add_card(first)
+            hand.add_card(second)
+            if 10 <= hand.get_value() <= 13:
+                pairs.append((first, second))
+    return np.array(pairs, dtype=np.int16)
+
+
+# Pada dek baru, memilih salah satu pasangan ini secara seragam sama dengan
+# distribusi bersyarat yang dipakai Deck.draw_opening_pair(10, 13)
+OPENING_PAIRS = _opening_card_pairs()
+
+
+def add_cards(total, soft, cards, mask):
+    """Menambah kartu ke tangan yang mask-nya True (di tempat), seperti Hand.add_card"""
+    total += np.where(mask, VALUES[cards], 0)
+    soft += np.where(mask, IS_ACE[cards], 0)
+    # Satu kartu bisa memaksa paling banyak dua Ace soft menjadi 1
+    for _ in range(2):
+        reduce = (total > 21) & (soft > 0)
+        total -= 10 * reduce
+        soft -= reduce
+
+
+class BatchBlackJack:
+    """N ronde Black Jack yang dimainkan bersamaan dengan array NumPy.
+
+    Kebijakan pemain: stand_on (ambil kartu selama nilai di bawahnya) atau
+    tabel StrategyTable dari blackjack_solver.
+    """
+    def __init__(self, stand_on=17, table=None, bucket=None):
+        self.stand_on = stand_on
+        self.hits = None
+        if table is not None:
+            from blackjack_solver import FRESH_BUCKET
+            self.hits = np.frombuffer(table.hits, dtype=np.uint8).astype(bool)
+            self.bucket = FRESH_BUCKET if bucket is None else bucket
+
+    def wants_hit(self, total, soft, upcard):
+        """Keputusan draw untuk setiap ronde"""
+        if self.hits is None:
+            return total < self.stand_on
+        # Sama dengan blackjack_solver.table_index
+        index = ((self.bucket * 11 + upcard) * 2 + (soft > 0)) * 22 + np.minimum(total, 21)
+        return self.hits[index]
+
+    def play(self, rounds, rng):
+        """Memainkan sejumlah ronde. Mengembalikan (hasil, pemain_bust, dealer_bust).
+
+        hasil: 1 = pemain menang, -1 = dealer menang, 0 = draw
+        """
+        rows = np.arange(rounds)
+
+        # Dealer: pasangan pembuka langsung; sisa 50 kartu diacak menjadi dek
+        dealer_cards = OPENING_PAIRS[rng.integers(len(OPENING_PAIRS), size=rounds)]
+        keys = rng.random((rounds, DECK_SIZE), dtype=np.float32)
+        keys[rows[:, None], dealer_cards] = 2.0  # kartu dealer diletakkan di akhir
+        shoe = np.argsort(keys, axis=1)[:, :SHOE_SIZE].astype(np.int16)
+
+        dealer_total = np.zeros(rounds, dtype=np.int16)
+        dealer_soft = np.zeros(rounds, dtype=np.int16)
+        everyone = np.ones(rounds, dtype=bool)
+        add_cards(dealer_total, dealer_soft, dealer_cards[:, 0], everyone)
+        add_cards(dealer_total, dealer_soft, dealer_cards[:, 1], everyone)
+        upcard = LOW_VALUES[dealer_cards[:, 1]]
+
+        # Pemain: dua kartu teratas dek
+        player_total = np.zeros(rounds, dtype=np.int16)
+        player_soft = np.zeros(rounds, dtype=np.int16)
+        add_cards(player_total, player_soft, shoe[:, 0], everyone)
+        add_cards(player_total, player_soft, shoe[:, 1], everyone)
+        position = np.full(rounds, 2, dtype=np.int16)
+
+        # Giliran pemain (Black Jack langsung tidak mengambil kartu)
+        natural = player_total == 21
+        active = ~natural
+        while True:
+            active &= self.wants_hit(player_total, player_soft, upcard)
+            if not active.any():
+                break
+            cards = shoe[rows, np.minimum(position, SHOE_SIZE - 1)]
+            add_cards(player_total, player_soft, cards, active)
+            position += active
+            active &= player_total <= 21
+        player_bust = player_total > 21
+
+        # Giliran dealer: kartu Ace-6 berikutnya yang belum terpakai di dek
+        # next_low[r, j] = posisi kartu Ace-6 pertama di dek r mulai dari j
+        low_index = np.full((rounds, SHOE_SIZE + 1), SHOE_SIZE, dtype=np.int16)
+        low_index[:, :SHOE_SIZE] = np.where(LOW_VALUES[shoe] <= 6, np.arange(SHOE_SIZE), SHOE_SIZE)
+        next_low = np.minimum.accumulate(low_index[:, ::-1], axis=1)[:, ::-1]
+
+        playing = ~natural & ~player_bust
+        low_position = position.copy()
+        while True:
+            need = playing & (dealer_total < 17)
+            if not need.any():
+                break
+            index = next_low[rows, low_position]
+            cards = shoe[rows, np.minimum(index, SHOE_SIZE - 1)]
+            # Tidak ada kartu Ace-6 tersisa: seperti Deck, ambil dari dek baru
+            empty = index == SHOE_SIZE
+            if (need & empty).any():
+                cards = np.where(empty, rng.choice(LOW_CARDS, size=rounds), cards)
+            add_cards(dealer_total, dealer_soft, cards, need)
+            low_position = np.where(need & ~empty, index + 1, low_position)
+        dealer_bust = playing & (dealer_total > 21)
+
+        # Aturan determine_winner
+        outcome = np.sign(player_total - dealer_total).astype(np.int8)
+        outcome[dealer_bust] = 1
+        outcome[natural] = 1
+        outcome[player_bust] = -1
+        return outcome, player_bust, dealer_bust
+
+
+def simulate_batch(hands, stand_on=17, table=None, seed=0, bet=1, batch_size=BATCH_SIZE):
+    """Mensimulasikan banyak tangan per batch dan mengembalikan SimulationResult"""
+    engine = BatchBlackJack(stand_on, table)
+    rng = np.random.default_rng(seed)
+    result = SimulationResult(bet=bet)
+
+    remaining = hands
+    while remaining > 0:
+        rounds = min(batch_size, remaining)
+        outcome, player_bust, dealer_bust = engine.play(rounds, rng)
+        wins = int(np.count_nonzero(outcome == 1))
+        losses = int(np.count_nonzero(outcome == -1))
+        result.merge((wins, losses, rounds - wins - losses,
+                      int(player_bust.sum()), int(dealer_bust.sum()), (wins - losses) * bet))
+        remaining -= rounds
+    return result
+
+
+def check_against_scalar(hands, stand_on=17, seed=0):
+    """Membandingkan distribusi hasil batch dengan simulasi skalar (blackjack_sim).
+
+    Mengembalikan True jika semua selisih proporsi di bawah 4 standard error.
+    """
+    batch = simulate_batch(hands, stand_on=stand_on, seed=seed)
+    scalar = simulate(hands, StandOn(stand_on), seed=seed)
+
+    ok = True
+    print(f"{'':>14} {'batch':>10} {'skalar':>10} {'z':>7}")
+    for name in ("player_wins", "dealer_wins", "draws", "player_busts", "dealer_busts"):
+        p1 = getattr(batch, name) / batch.hands
+        p2 = getattr(scalar, name) / scalar.hands
+        pooled = (p1 + p2) / 2
+        error = (pooled * (1 - pooled) * (1 / batch.hands + 1 / scalar.hands)) ** 0.5
+        z = (p1 - p2) / error if error else 0.0
+        ok &= abs(z) < 4
+        print(f"{name:>14} {p1:>10.5f} {p2:>10.5f} {z:>+7.2f}")
+    return ok
+
+
+def main():
+    """Fungsi utama untuk menjalankan evaluator batch dari command line"""
+    parser = argparse.ArgumentParser(description="Evaluator Black Jack berbasis NumPy")
+    parser.add_argument("--hands", type=int, default=10_000_000, help="jumlah tangan")
+    parser.add_argument("--seed", type=int, default=0, help="seed RNG")
+    parser.add_argument("--bet", type=int, default=1, help="taruhan wortel per tangan")
+    parser.add_argument("--stand-on", type=int, default=17, help="pemain stand pada nilai ini atau lebih")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="ronde per batch")
+    parser.add_argument("--table", help="file tabel strategi dari blackjack_solver.py")
+    parser.add_argument("--check", action="store_true", help="bandingkan dengan simulasi skalar")
+    args = parser.parse_args()
+
+    if args.check:
+        ok = check_against_scalar(args.hands, args.stand_on, args.seed)
+        print("✓ Distribusi sama" if ok else "✗ Distribusi berbeda!")
+        raise SystemExit(0 if ok else 1)
+
+    table = None
+    if args.table:
+        from blackjack_solver import StrategyTable
+        table = StrategyTable.load(args.table)
+
+    start = time.perf_counter()
+    result = simulate_batch(args.hands, args.stand_on, table, args.seed, args.bet, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    print(result)
+    print(f"  Waktu: {elapsed:.2f} detik ({result.hands / elapsed:,.0f} tangan/detik)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Riwayat tangan Black Jack dalam format biner dengan panjang record tetap
+Setiap ronde (taruhan, kartu, keputusan, hasil) ditulis sebagai satu record
+ke file append-only. Pembaca memakai mmap dan mengambil kolom langsung dari
+file sehingga statistik bisa dihitung tanpa memuat semua ronde ke Python.
+
+Contoh:
+    python blackjack_sim.py --hands 1000000 --history riwayat/
+    python blackjack_history.py riwayat/*.bjh
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from collections import Counter
+
+from blackjack import CARD_VALUES
+
+MAGIC = b"BJHH"
+VERSION = 1
+MAX_CARDS = 12  # tangan bernilai <= 21 paling banyak 11 kartu
+EMPTY_CARD = 0xFF
+
+# bet, wortel setelah ronde, kartu pemain, kartu dealer, nilai awal pemain,
+# nilai akhir pemain, nilai akhir dealer, jumlah draw, hasil, flag
+RECORD = struct.Struct(f"<Iq{MAX_CARDS}s{MAX_CARDS}sBBBBbB")
+HEADER = struct.Struct("<4sHH")
+
+# Posisi kolom 1 byte di dalam record
+START_OFFSET = 4 + 8 + 2 * MAX_CARDS
+OUTCOME_OFFSET = START_OFFSET + 4
+FLAGS_OFFSET = OUTCOME_OFFSET + 1
+
+OUTCOMES = {"player": 1, "dealer": -1, "draw": 0}
+FLAG_PLAYER_BUST = 1
+FLAG_DEALER_BUST = 2
+FLAG_NATURAL = 4
+
+
+def pack_cards(cards):
+    """Kode kartu -> MAX_CARDS byte (sisa diisi EMPTY_CARD)"""
+    data = bytes(cards[:MAX_CARDS])
+    return data + bytes([EMPTY_CARD]) * (MAX_CARDS - len(data))
+
+
+def opening_value(cards):
+    """Nilai dua kartu pertama"""
+    value = CARD_VALUES[cards[0]] + CARD_VALUES[cards[1]]
+    return value - 10 if value > 21 else value
+
+
+class HistoryWriter:
+    """Menulis record ronde ke file dengan buffer besar (append-only)"""
+    def __init__(self, filename, buffer_records=65536):
+        is_new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, 'ab')
+        if is_new:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.buffer = bytearray(RECORD.size * buffer_records)
+        self.capacity = buffer_records
+        self.pending = 0
+
+    def write_round(self, bet, wortel, player_hand, dealer_hand, winner):
+        """Menambahkan satu ronde dari tangan pemain dan dealer"""
+        player_value = player_hand.get_value()
+        dealer_value = dealer_hand.get_value()
+
+        flags = 0
+        if player_value > 21:
+            flags |= FLAG_PLAYER_BUST
+        if dealer_value > 21:
+            flags |= FLAG_DEALER_BUST
+        if len(player_hand.cards) == 2 and player_value == 21:
+            flags |= FLAG_NATURAL
+
+        RECORD.pack_into(
+            self.buffer, self.pending * RECORD.size,
+            bet, wortel, pack_cards(player_hand.cards), pack_cards(dealer_hand.cards),
+            opening_value(player_hand.cards), player_value, dealer_value,
+            len(player_hand.cards) - 2, OUTCOMES[winner], flags,
+        )
+        self.pending += 1
+        if self.pending == self.capacity:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.file.write(memoryview(self.buffer)[:self.pending * RECORD.size])
+            self.pending = 0
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HistoryReader:
+    """Membaca file riwayat lewat mmap tanpa memuat seluruh isinya"""
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = open(filename, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{filename} bukan file riwayat Black Jack versi {VERSION}")
+        self.count = (len(self.map) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self.count
+
+    def record(self, index):
+        """Record ke-index sebagai tuple (akses langsung, O(1))"""
+        return RECORD.unpack_from(self.map, HEADER.size + index * RECORD.size)
+
+    def columns(self, chunk_records=1 << 20):
+        """Menghasilkan (nilai awal, hasil, flag) per potongan sebagai bytes kolom"""
+        for first in range(0, self.count, chunk_records):
+            last = min(self.count, first + chunk_records)
+            block = self.map[HEADER.size + first * RECORD.size:HEADER.size + last * RECORD.size]
+            yield (block[START_OFFSET::RECORD.size],
+                   block[OUTCOME_OFFSET::RECORD.size],
+                   block[FLAGS_OFFSET::RECORD.size])
+
+    def bankroll_curve(self, points=50):
+        """Wortel setelah ronde pada sejumlah titik yang tersebar rata"""
+        if self.count == 0:
+            return []
+        step = max(1, self.count // points)
+        return [(i, self.record(i)[1]) for i in range(step - 1, self.count, step)]
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+class HistoryStats:
+    """Statistik agregat dari satu atau lebih file riwayat"""
+    def __init__(self):
+        self.rounds = 0
+        self.by_start = Counter()  # (nilai awal, hasil) -> jumlah
+        self.flags = Counter()
+
+    def add(self, reader):
+        for start, outcome, flags in reader.columns():
+            self.rounds += len(start)
+            # Byte hasil adalah int8: 255 berarti -1 (dealer menang)
+            self.by_start.update(zip(start, outcome))
+            self.flags.update(flags)
+
+    def count_flag(self, flag):
+        return sum(n for value, n in self.flags.items() if value & flag)
+
+    def win_rates(self):
+        """{nilai awal: (ronde, % menang, % kalah, % draw)}"""
+        totals = {}
+        for (start, outcome), n in self.by_start.items():
+            row = totals.setdefault(start, [0, 0, 0])
+            row[0 if outcome == 1 else 1 if outcome == 255 else 2] += n
+        rates = {}
+        for start, (wins, losses, draws) in sorted(totals.items()):
+            n = wins + losses + draws
+            rates[start] = (n, wins / n, losses / n, draws / n)
+        return rates
+
+
+def main():
+    """Fungsi utama untuk menampilkan statistik dari file riwayat"""
+    parser = argparse.ArgumentParser(description="Statistik riwayat tangan Black Jack")
+    parser.add_argument("files", nargs="+", help="file .bjh")
+    parser.add_argument("--points", type=int, default=20, help="titik kurva wortel per file")
+    args = parser.parse_args()
+
+    stats = HistoryStats()
+    curves = []
+    for filename in args.files:
+        reader = HistoryReader(filename)
+        stats.add(reader)
+        curves.append((filename, reader.bankroll_curve(args.points)))
+        reader.close()
+
+    if stats.rounds == 0:
+        print("Riwayat kosong.")
+        return
+
+    print("=" * 60)
+    print(f"RIWAYAT: {stats.rounds} ronde dari {len(args.files)} file")
+    print("=" * 60)
+    print(f"Pemain Bust: {stats.count_flag(FLAG_PLAYER_BUST) / stats.rounds:.4%}")
+    print(f"Dealer Bust: {stats.count_flag(FLAG_DEALER_BUST) / stats.rounds:.4%}")
+    print(f"Black Jack langsung: {stats.count_flag(FLAG_NATURAL) / stats.rounds:.4%}")
+
+    print("\nNilai Awal | Ronde      | Menang  | Kalah   | Draw")
+    for start, (n, wins, losses, draws) in stats.win_rates().items():
+        print(f"    {start:>2}     | {n:<10} | {wins:6.2%} | {losses:6.2%} | {draws:6.2%}")
+
+    for filename, curve in curves:
+        print(f"\nKurva wortel: {filename}")
+        for index, wortel in curve:
+            print(f"  ronde {index + 1:>10}: 🥕 {wortel}")
+
+
+if __name__ == "__main__":
+    main()
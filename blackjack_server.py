@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Server Black Jack multi-meja berbasis asyncio
+Setiap koneksi mendapat meja sendiri (Deck, wortel dan statistik sendiri) dan
+bermain lewat protokol baris teks sederhana di TCP atau Unix socket.
+
+Protokol (satu perintah per baris, balasan satu baris):
+    BET <n>   -> DEAL <kartu pemain> <nilai> <kartu terbuka dealer>
+                 atau RESULT ... jika pemain langsung mendapat 21
+    HIT       -> CARD <kartu> <nilai>  atau RESULT ... jika bust
+    STAND     -> RESULT <pemenang> <nilai pemain> <nilai dealer> <wortel>
+    STATS     -> STATS <menang> <kalah> <draw> <wortel>
+    QUIT      -> BYE
+    Kesalahan -> ERR <pesan>
+
+Contoh:
+    python blackjack_server.py serve --port 7777
+    python blackjack_server.py bots --port 7777 --clients 2000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import time
+from array import array
+
+from blackjack import RANKS, SUITS, Deck
+from blackjack_sim import deal_hands, settle
+
+START_WORTEL = 50
+MAX_LINE = 128  # batas panjang satu perintah (byte)
+LATENCY_SAMPLES = 65536
+
+CARD_LABELS = tuple(
+    f"{'A' if rank == 'Ace' else rank[0] if rank in ('Jack', 'Queen', 'King') else rank}{suit[0]}"
+    for suit in SUITS for rank in RANKS
+)
+
+
+class LatencyStats:
+    """Ring buffer waktu respons (detik) dengan ukuran tetap"""
+    def __init__(self, size=LATENCY_SAMPLES):
+        self.samples = array('d', bytes(8 * size))
+        self.size = size
+        self.count = 0
+
+    def add(self, seconds):
+        self.samples[self.count % self.size] = seconds
+        self.count += 1
+
+    def percentile(self, p):
+        """Persentil p (0-100) dari sampel terbaru, dalam detik"""
+        n = min(self.count, self.size)
+        if n == 0:
+            return 0.0
+        ordered = sorted(self.samples[:n])
+        return ordered[min(n - 1, int(n * p / 100))]
+
+    def summary(self):
+        return (f"aksi: {self.count} | p50 {self.percentile(50) * 1e3:.3f} ms | "
+                f"p99 {self.percentile(99) * 1e3:.3f} ms")
+
+
+class Table:
+    """Satu meja Black Jack tanpa input/print; setiap perintah langsung dijawab"""
+    def __init__(self, wortel=START_WORTEL):
+        self.deck = Deck()
+        self.wortel = wortel
+        self.bet = 0
+        self.player_hand = None
+        self.dealer_hand = None
+        self.player_wins = 0
+        self.dealer_wins = 0
+        self.draws = 0
+
+    def handle(self, line):
+        """Memproses satu baris perintah dan mengembalikan balasannya"""
+        parts = line.split()
+        if not parts:
+            return "ERR perintah kosong"
+        command = parts[0].upper()
+
+        if command == "BET":
+            if len(parts) != 2 or not parts[1].isdecimal():
+                return "ERR format: BET <jumlah>"
+            return self.place_bet(int(parts[1]))
+        if command == "HIT":
+            return self.hit()
+        if command == "STAND":
+            return self.stand()
+        if command == "STATS":
+            return f"STATS {self.player_wins} {self.dealer_wins} {self.draws} {self.wortel}"
+        return f"ERR perintah tidak dikenal: {command}"
+
+    def place_bet(self, bet):
+        if self.player_hand is not None:
+            return "ERR ronde masih berjalan"
+        if bet <= 0 or bet > self.wortel:
+            return f"ERR taruhan harus 1-{self.wortel}"
+
+        self.bet = bet
+        self.wortel -= bet
+        # Seperti main(), setiap ronde memakai dek baru
+        self.deck.reset()
+        self.player_hand, self.dealer_hand = deal_hands(self.deck)
+
+        if self.player_hand.get_value() == 21:
+            return self.finish("player")
+
+        cards = ",".join(CARD_LABELS[code] for code in self.player_hand.cards)
+        upcard = CARD_LABELS[self.dealer_hand.cards[1]]
+        return f"DEAL {cards} {self.player_hand.get_value()} {upcard}"
+
+    def hit(self):
+        if self.player_hand is None:
+            return "ERR belum ada taruhan"
+        card = self.deck.draw_card()
+        self.player_hand.add_card(card)
+        if self.player_hand.get_value() > 21:
+            return self.finish("dealer")
+        return f"CARD {CARD_LABELS[card]} {self.player_hand.get_value()}"
+
+    def stand(self):
+        if self.player_hand is None:
+            return "ERR belum ada taruhan"
+        while self.dealer_hand.get_value() < 17:
+            self.dealer_hand.add_card(self.deck.draw_card_limited())
+        return self.finish(settle(self.player_hand.get_value(), self.dealer_hand.get_value()))
+
+    def finish(self, winner):
+        """Membayar taruhan, memperbarui statistik dan menutup ronde"""
+        if winner == "player":
+            self.wortel += self.bet * 2
+            self.player_wins += 1
+        elif winner == "draw":
+            self.wortel += self.bet
+            self.draws += 1
+        else:
+            self.dealer_wins += 1
+
+        reply = (f"RESULT {winner} {self.player_hand.get_value()} "
+                 f"{self.dealer_hand.get_value()} {self.wortel}")
+        self.player_hand = None
+        self.dealer_hand = None
+
+        # Wortel habis: meja di-reset seperti di main()
+        if self.wortel <= 0:
+            self.wortel = START_WORTEL
+            self.player_wins = self.dealer_wins = self.draws = 0
+            reply += " RESET"
+        return reply
+
+
+class BlackJackServer:
+    """Server yang menampung banyak meja sekaligus"""
+    def __init__(self, max_tables=10000):
+        self.max_tables = max_tables
+        self.tables = 0
+        self.next_id = 1
+        self.latency = LatencyStats()
+
+    async def handle_client(self, reader, writer):
+        if self.tables >= self.max_tables:
+            writer.write(b"ERR server penuh\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        table = Table()
+        table_id = self.next_id
+        self.next_id += 1
+        self.tables += 1
+        try:
+            writer.write(f"WELCOME {table_id} {table.wortel}\n".encode())
+            await writer.drain()
+            while True:
+                try:
+                    data = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b"ERR baris terlalu panjang\n")
+                    break
+                if not data:
+                    break
+
+                start = time.perf_counter()
+                line = data.decode(errors="replace").strip()
+                if line.upper() == "QUIT":
+                    writer.write(b"BYE\n")
+                    break
+                try:
+                    reply = table.handle(line)
+                except Exception as e:
+                    # Satu perintah yang gagal tidak boleh memutus koneksi
+                    reply = f"ERR perintah tidak valid: {e}"
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+                self.latency.add(time.perf_counter() - start)
+        except ConnectionError:
+            pass
+        finally:
+            self.tables -= 1
+            writer.close()
+
+    async def report(self, interval):
+        """Mencetak jumlah meja dan latensi secara berkala"""
+        while True:
+            await asyncio.sleep(interval)
+            print(f"Meja aktif: {self.tables} | {self.latency.summary()}")
+
+    async def serve(self, host="127.0.0.1", port=7777, unix_path=None, report_interval=10):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, unix_path, limit=MAX_LINE)
+            print(f"✓ Server Black Jack berjalan di {unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port,
+                                                limit=MAX_LINE, backlog=4096)
+            print(f"✓ Server Black Jack berjalan di {host}:{port}")
+
+        reporter = asyncio.create_task(self.report(report_interval))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            reporter.cancel()
+            print(f"Server berhenti | {self.latency.summary()}")
+
+
+async def play_bot(host, port, unix_path, rounds, latency):
+    """Satu bot: bertaruh 1 wortel dan stand pada 17 atau lebih"""
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()
+
+    async def send(command):
+        start = time.perf_counter()
+        writer.write(command.encode() + b"\n")
+        reply = (await reader.readline()).decode().split()
+        latency.add(time.perf_counter() - start)
+        return reply
+
+    for _ in range(rounds):
+        reply = await send("BET 1")
+        while reply[0] in ("DEAL", "CARD"):
+            # DEAL dan CARD sama-sama membawa nilai pemain di kolom ketiga
+            reply = await send("HIT" if int(reply[2]) < 17 else "STAND")
+    writer.write(b"QUIT\n")
+    await reader.readline()
+    writer.close()
+
+
+async def run_bots(clients, rounds, host="127.0.0.1", port=7777, unix_path=None):
+    """Load generator: menjalankan banyak bot secara bersamaan"""
+    latency = LatencyStats()
+    start = time.perf_counter()
+    await asyncio.gather(*(play_bot(host, port, unix_path, rounds, latency) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    print(f"Bot: {clients} | Ronde: {clients * rounds} | Waktu: {elapsed:.2f} detik")
+    print(f"Latensi sisi klien | {latency.summary()}")
+
+
+def main():
+    """Fungsi utama untuk menjalankan server atau load generator"""
+    parser = argparse.ArgumentParser(description="Server Black Jack multi-meja")
+    parser.add_argument("mode", choices=["serve", "bots"], help="jalankan server atau bot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="pakai Unix socket di path ini")
+    parser.add_argument("--max-tables", type=int, default=10000, help="batas meja bersamaan")
+    parser.add_argument("--report", type=float, default=10, help="interval laporan (detik)")
+    parser.add_argument("--clients", type=int, default=100, help="jumlah bot")
+    parser.add_argument("--rounds", type=int, default=10, help="ronde per bot")
+    args = parser.parse_args()
+
+    try:
+        if args.mode == "serve":
+            server = BlackJackServer(args.max_tables)
+            asyncio.run(server.serve(args.host, args.port, args.unix, args.report))
+        else:
+            asyncio.run(run_bots(args.clients, args.rounds, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nServer dihentikan.")
+
+
+if __name__ == "__main__":
+    main()
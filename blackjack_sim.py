@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Simulasi Black Jack tanpa input/print (headless)
+Memainkan banyak tangan dengan kebijakan pemain yang bisa diganti,
+dibagi ke beberapa proses dengan aliran RNG yang independen.
+
+Contoh:
+    python blackjack_sim.py --hands 10000000 --workers 8 --seed 42 --stand-on 17
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import time
+from multiprocessing import Pool
+
+from blackjack import CARD_VALUES, Deck, Hand
+from blackjack_history import HistoryWriter
+
+# Jumlah tangan per potongan (chunk). Ukurannya tetap sehingga pembagian
+# potongan dan seed-nya tidak bergantung pada jumlah worker.
+CHUNK_SIZE = 100_000
+
+
+class StandOn:
+    """Kebijakan pemain: ambil kartu selama nilai tangan di bawah threshold"""
+    def __init__(self, threshold=17):
+        self.threshold = threshold
+
+    def __call__(self, player_hand, dealer_upcard):
+        return player_hand.get_value() < self.threshold
+
+    def __repr__(self):
+        return f"StandOn({self.threshold})"
+
+
+class SimulationResult:
+    """Hasil agregat dari simulasi"""
+    def __init__(self, hands=0, player_wins=0, dealer_wins=0, draws=0,
+                 player_busts=0, dealer_busts=0, wortel=0, bet=1):
+        self.hands = hands
+        self.player_wins = player_wins
+        self.dealer_wins = dealer_wins
+        self.draws = draws
+        self.player_busts = player_busts
+        self.dealer_busts = dealer_busts
+        self.wortel = wortel  # total untung/rugi wortel
+        self.bet = bet
+
+    def merge(self, counts):
+        """Menambahkan hitungan dari satu potongan"""
+        wins, losses, draws, player_busts, dealer_busts, wortel = counts
+        self.hands += wins + losses + draws
+        self.player_wins += wins
+        self.dealer_wins += losses
+        self.draws += draws
+        self.player_busts += player_busts
+        self.dealer_busts += dealer_busts
+        self.wortel += wortel
+
+    @property
+    def ev(self):
+        """Rata-rata untung/rugi wortel per tangan"""
+        return self.wortel / self.hands if self.hands else 0.0
+
+    def __str__(self):
+        if not self.hands:
+            return "Tidak ada tangan yang dimainkan."
+        return (
+            f"Tangan: {self.hands}\n"
+            f"  Pemain Menang: {self.player_wins} ({self.player_wins / self.hands:.4%})\n"
+            f"  Dealer Menang: {self.dealer_wins} ({self.dealer_wins / self.hands:.4%})\n"
+            f"  Draw: {self.draws} ({self.draws / self.hands:.4%})\n"
+            f"  Pemain Bust: {self.player_busts} | Dealer Bust: {self.dealer_busts}\n"
+            f"  Total Wortel: 🥕 {self.wortel:+d} (taruhan {self.bet} per tangan)\n"
+            f"  EV per tangan: 🥕 {self.ev:+.5f} ({self.ev / self.bet:+.4%} dari taruhan)"
+        )
+
+
+def settle(player_value, dealer_value):
+    """Menentukan pemenang dengan aturan yang sama seperti BlackJack.determine_winner"""
+    if player_value > 21:
+        return "dealer"
+    if dealer_value > 21:
+        return "player"
+    if player_value > dealer_value:
+        return "player"
+    if dealer_value > player_value:
+        return "dealer"
+    return "draw"
+
+
+def deal_hands(deck):
+    """Membagikan kartu awal; dealer langsung mendapat nilai 10-13"""
+    player_hand = Hand()
+    dealer_hand = Hand()
+    for card in deck.draw_opening_pair(10, 13):
+        dealer_hand.add_card(card)
+    for _ in range(2):
+        player_hand.add_card(deck.draw_card())
+    return player_hand, dealer_hand
+
+
+def finish_hand(deck, player_hand, dealer_hand, policy):
+    """Melanjutkan ronde dari giliran pemain sampai selesai. Mengembalikan pemenang"""
+    # Kartu pertama dealer tersembunyi, jadi yang terlihat adalah kartu kedua
+    dealer_upcard = CARD_VALUES[dealer_hand.cards[1]]
+
+    while policy(player_hand, dealer_upcard):
+        player_hand.add_card(deck.draw_card())
+        if player_hand.get_value() > 21:
+            return "dealer"
+
+    while dealer_hand.get_value() < 17:
+        dealer_hand.add_card(deck.draw_card_limited())
+
+    return settle(player_hand.get_value(), dealer_hand.get_value())
+
+
+def play_hand(deck, policy):
+    """Memainkan satu tangan tanpa input/print. Mengembalikan (pemenang, tangan pemain, tangan dealer)"""
+    player_hand, dealer_hand = deal_hands(deck)
+
+    # Black Jack langsung: pemain menang tanpa giliran dealer
+    if player_hand.get_value() == 21:
+        return "player", player_hand, dealer_hand
+
+    return finish_hand(deck, player_hand, dealer_hand, policy), player_hand, dealer_hand
+
+
+def never_hit(player_hand, dealer_upcard):
+    """Kebijakan: langsung stand"""
+    return False
+
+
+def rollout(game, action, rounds, policy=None, seed=0):
+    """EV rata-rata (per taruhan) jika pemain melakukan action ('hit' atau 'stand')
+    dari posisi game saat ini, lalu melanjutkan dengan policy.
+
+    Meja asal tidak berubah: setiap percobaan memakai cabang dari game.fork()
+    yang dikembalikan ke snapshot yang sama.
+    """
+    if policy is None:
+        policy = StandOn(17)
+    branch = game.fork(random.Random(seed))
+    snapshot = branch.snapshot()
+
+    net = 0
+    for _ in range(rounds):
+        branch.restore(snapshot, restore_rng=False)
+        deck, player_hand, dealer_hand = branch.deck, branch.player_hand, branch.dealer_hand
+        if action == "hit":
+            player_hand.add_card(deck.draw_card())
+            if player_hand.get_value() > 21:
+                net -= 1
+                continue
+            winner = finish_hand(deck, player_hand, dealer_hand, policy)
+        else:
+            winner = finish_hand(deck, player_hand, dealer_hand, never_hit)
+        net += 1 if winner == "player" else -1 if winner == "dealer" else 0
+    return net / rounds
+
+
+def what_if(game, rounds=10000, policy=None, seed=0):
+    """Membandingkan hit dan stand dari posisi game saat ini: {'hit': EV, 'stand': EV}"""
+    return {
+        "hit": rollout(game, "hit", rounds, policy, seed),
+        "stand": rollout(game, "stand", rounds, policy, seed + 1),
+    }
+
+
+def chunk_seed(seed, chunk_index):
+    """Menurunkan seed independen untuk satu potongan dari seed utama"""
+    digest = hashlib.sha256(f"{seed}:{chunk_index}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def run_chunk(args):
+    """Memainkan satu potongan tangan dengan dek dan RNG sendiri"""
+    seed, chunk_index, hands, policy, bet, history_dir = args
+    deck = Deck(rng=random.Random(chunk_seed(seed, chunk_index)))
+    history = None
+    if history_dir:
+        history = HistoryWriter(os.path.join(history_dir, f"chunk-{chunk_index:05d}.bjh"))
+
+    wins = losses = draws = player_busts = dealer_busts = 0
+    for _ in range(hands):
+        # Seperti main(), setiap ronde dimainkan dengan dek baru
+        deck.reset()
+        winner, player_hand, dealer_hand = play_hand(deck, policy)
+        if winner == "player":
+            wins += 1
+        elif winner == "dealer":
+            losses += 1
+        else:
+            draws += 1
+        player_busts += player_hand.get_value() > 21
+        dealer_busts += dealer_hand.get_value() > 21
+        if history is not None:
+            history.write_round(bet, (wins - losses) * bet, player_hand, dealer_hand, winner)
+
+    if history is not None:
+        history.close()
+    return wins, losses, draws, player_busts, dealer_busts, (wins - losses) * bet
+
+
+def simulate(hands, policy=None, workers=None, seed=0, bet=1, chunk_size=CHUNK_SIZE,
+             history_dir=None):
+    """Mensimulasikan banyak tangan dan mengembalikan SimulationResult.
+
+    Hasil hanya bergantung pada seed, hands dan chunk_size, bukan jumlah worker.
+    Jika history_dir diisi, setiap potongan menulis riwayat tangannya ke file .bjh
+    sendiri (wortel di riwayat adalah untung/rugi kumulatif potongan tersebut).
+    """
+    if policy is None:
+        policy = StandOn(17)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if history_dir:
+        os.makedirs(history_dir, exist_ok=True)
+
+    tasks = []
+    for chunk_index, start in enumerate(range(0, hands, chunk_size)):
+        tasks.append((seed, chunk_index, min(chunk_size, hands - start), policy, bet, history_dir))
+
+    result = SimulationResult(bet=bet)
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            result.merge(run_chunk(task))
+    else:
+        with Pool(processes=min(workers, len(tasks))) as pool:
+            for counts in pool.imap_unordered(run_chunk, tasks):
+                result.merge(counts)
+    return result
+
+
+def main():
+    """Fungsi utama untuk menjalankan simulasi dari command line"""
+    parser = argparse.ArgumentParser(description="Simulasi Black Jack tanpa tampilan")
+    parser.add_argument("--hands", type=int, default=1_000_000, help="jumlah tangan")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default: semua core)")
+    parser.add_argument("--seed", type=int, default=0, help="seed utama")
+    parser.add_argument("--bet", type=int, default=1, help="taruhan wortel per tangan")
+    parser.add_argument("--stand-on", type=int, default=17, help="pemain stand pada nilai ini atau lebih")
+    parser.add_argument("--history", metavar="DIR", help="tulis riwayat tangan biner ke folder ini")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = simulate(args.hands, StandOn(args.stand_on), args.workers, args.seed, args.bet,
+                      history_dir=args.history)
+    elapsed = time.perf_counter() - start
+
+    print(result)
+    print(f"  Waktu: {elapsed:.2f} detik ({result.hands / elapsed:,.0f} tangan/detik)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Solver EV eksak untuk aturan Black Jack di blackjack.py
+Menghitung EV draw dan stand untuk setiap (nilai pemain, soft, kartu terbuka
+dealer, bucket komposisi dek) dengan dynamic programming + memoization, lalu
+menyimpannya sebagai tabel kecil yang bisa dibaca O(1) oleh mode advisor.
+
+Aturan yang dimodelkan:
+  - dealer membuka dengan 2 kartu bernilai 10-13 (kartu kedua terbuka)
+  - dealer mengambil kartu terbatas (Ace-6) selama nilainya di bawah 17
+  - pemenang ditentukan seperti BlackJack.determine_winner
+
+Peluang kartu dianggap tetap selama satu ronde (model dek tak hingga) untuk
+komposisi wakil setiap bucket.
+
+Contoh:
+    python blackjack_solver.py --save blackjack_strategy.bin
+"""
+
+import argparse
+from array import array
+from functools import lru_cache
+
+from blackjack import CARD_LOW_VALUES, FULL_BUCKETS, FULL_DECK, opening_pairs
+
+# Bucket komposisi: selisih porsi kartu rendah (Ace-6) dari dek baru,
+# dengan lebar BUCKET_WIDTH per bucket. Bucket tengah = dek baru.
+N_BUCKETS = 9
+BUCKET_WIDTH = 0.05
+FRESH_BUCKET = N_BUCKETS // 2
+
+FRESH_COUNTS = [len(cards) for cards in FULL_BUCKETS]  # indeks = nilai terendah kartu
+FRESH_LOW = sum(FRESH_COUNTS[1:7])
+FRESH_HIGH = len(FULL_DECK) - FRESH_LOW
+
+# Hasil akhir dealer: indeks 0-4 untuk nilai 17-21, indeks 5 untuk bust
+BUST = 5
+
+TOTALS = 22  # nilai pemain 0-21
+TABLE_MAGIC = b"BJST"
+
+
+def shoe_bucket(deck):
+    """Menentukan bucket komposisi dari isi dek saat ini"""
+    if len(deck) == 0:
+        return FRESH_BUCKET
+    low = sum(len(deck.buckets[value]) for value in range(1, 7))
+    offset = round((low / len(deck) - FRESH_LOW / len(FULL_DECK)) / BUCKET_WIDTH)
+    return min(N_BUCKETS - 1, max(0, FRESH_BUCKET + offset))
+
+
+@lru_cache(maxsize=None)
+def composition(bucket):
+    """Peluang tiap nilai kartu (indeks 1-10) untuk komposisi wakil bucket"""
+    low_share = FRESH_LOW / len(FULL_DECK) + (bucket - FRESH_BUCKET) * BUCKET_WIDTH
+    low_share = min(1.0, max(0.0, low_share))
+    probs = [0.0] * 11
+    for value in range(1, 11):
+        if value <= 6:
+            probs[value] = low_share * FRESH_COUNTS[value] / FRESH_LOW
+        else:
+            probs[value] = (1 - low_share) * FRESH_COUNTS[value] / FRESH_HIGH
+    return tuple(probs)
+
+
+def add_value(total, soft, value):
+    """Nilai tangan setelah menambah satu kartu, sama seperti Hand.add_card"""
+    aces = 1 if soft else 0
+    if value == 1:
+        total += 11
+        aces += 1
+    else:
+        total += value
+    while total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+    return total, aces > 0
+
+
+@lru_cache(maxsize=None)
+def dealer_outcomes(bucket, total, soft):
+    """Distribusi hasil akhir dealer dari nilai (total, soft)"""
+    outcomes = [0.0] * 6
+    if total > 21:
+        outcomes[BUST] = 1.0
+        return tuple(outcomes)
+    if total >= 17:
+        outcomes[total - 17] = 1.0
+        return tuple(outcomes)
+
+    # Dealer hanya mengambil kartu Ace-6
+    probs = composition(bucket)
+    low_total = sum(probs[1:7])
+    for value in range(1, 7):
+        weight = probs[value] / low_total
+        for i, p in enumerate(dealer_outcomes(bucket, *add_value(total, soft, value))):
+            outcomes[i] += weight * p
+    return tuple(outcomes)
+
+
+@lru_cache(maxsize=None)
+def dealer_given_upcard(bucket, upcard):
+    """Distribusi hasil akhir dealer jika kartu terbukanya bernilai upcard (Ace = 1)"""
+    probs = composition(bucket)
+    outcomes = [0.0] * 6
+    total_weight = 0.0
+    for hole, shown in opening_pairs(10, 13):
+        if shown != upcard:
+            continue
+        weight = probs[hole]
+        total_weight += weight
+        start = add_value(*add_value(0, False, hole), shown)
+        for i, p in enumerate(dealer_outcomes(bucket, *start)):
+            outcomes[i] += weight * p
+    if total_weight == 0:
+        return None
+    return tuple(p / total_weight for p in outcomes)
+
+
+def stand_ev(bucket, upcard, total):
+    """EV jika pemain stand dengan nilai total"""
+    outcomes = dealer_given_upcard(bucket, upcard)
+    ev = outcomes[BUST]
+    for i in range(5):
+        dealer_value = 17 + i
+        if total > dealer_value:
+            ev += outcomes[i]
+        elif total < dealer_value:
+            ev -= outcomes[i]
+    return ev
+
+
+@lru_cache(maxsize=None)
+def player_ev(bucket, upcard, total, soft):
+    """(EV stand, EV draw) untuk keadaan pemain"""
+    probs = composition(bucket)
+    ev_hit = 0.0
+    for value in range(1, 11):
+        next_total, next_soft = add_value(total, soft, value)
+        if next_total > 21:
+            ev_hit -= probs[value]
+        else:
+            ev_hit += probs[value] * max(player_ev(bucket, upcard, next_total, next_soft))
+    return stand_ev(bucket, upcard, total), ev_hit
+
+
+def table_index(bucket, upcard, soft, total):
+    """Posisi keadaan di dalam tabel strategi"""
+    return ((bucket * 11 + upcard) * 2 + soft) * TOTALS + total
+
+
+class StrategyTable:
+    """Tabel strategi hasil solver; setiap keadaan dibaca dengan satu indeks"""
+    def __init__(self, hits, ev_stand, ev_hit):
+        self.hits = hits          # bytes: 1 = draw, 0 = stand
+        self.ev_stand = ev_stand  # array('f')
+        self.ev_hit = ev_hit      # array('f')
+
+    @classmethod
+    def build(cls):
+        """Menghitung seluruh tabel dengan solver"""
+        size = table_index(N_BUCKETS, 0, 0, 0)
+        hits = bytearray(size)
+        ev_stand = array('f', bytes(4 * size))
+        ev_hit = array('f', bytes(4 * size))
+
+        for bucket in range(N_BUCKETS):
+            for upcard in range(1, 11):
+                if dealer_given_upcard(bucket, upcard) is None:
+                    continue
+                for soft in (0, 1):
+                    for total in range(2, 22):
+                        if soft and total < 12:
+                            continue  # Ace bernilai 11 berarti nilai minimal 12
+                        stand, hit = player_ev(bucket, upcard, total, bool(soft))
+                        index = table_index(bucket, upcard, soft, total)
+                        hits[index] = hit > stand
+                        ev_stand[index] = stand
+                        ev_hit[index] = hit
+        return cls(bytes(hits), ev_stand, ev_hit)
+
+    @classmethod
+    def load(cls, filename):
+        """Membaca tabel dari file biner"""
+        with open(filename, 'rb') as f:
+            if f.read(4) != TABLE_MAGIC:
+                raise ValueError(f"{filename} bukan file tabel strategi")
+            data = f.read()
+        size = len(data) // 9
+        ev_stand = array('f', data[size:5 * size])
+        ev_hit = array('f', data[5 * size:])
+        return cls(data[:size], ev_stand, ev_hit)
+
+    def save(self, filename):
+        """Menyimpan tabel ke file biner"""
+        with open(filename, 'wb') as f:
+            f.write(TABLE_MAGIC)
+            f.write(self.hits)
+            f.write(self.ev_stand.tobytes())
+            f.write(self.ev_hit.tobytes())
+
+    def lookup(self, bucket, upcard, soft, total):
+        """(draw?, EV draw, EV stand) untuk keadaan tertentu"""
+        index = table_index(bucket, upcard, 1 if soft else 0, total)
+        return bool(self.hits[index]), self.ev_hit[index], self.ev_stand[index]
+
+    def advise(self, player_hand, dealer_hand, deck):
+        """Saran untuk BlackJack.player_turn: (draw?, EV draw, EV stand)"""
+        upcard = CARD_LOW_VALUES[dealer_hand.cards[1]]
+        return self.lookup(shoe_bucket(deck), upcard, player_hand.is_soft(), player_hand.get_value())
+
+
+class TablePolicy:
+    """Kebijakan untuk blackjack_sim yang mengikuti tabel strategi"""
+    def __init__(self, table, bucket=FRESH_BUCKET):
+        self.table = table
+        self.bucket = bucket
+
+    def __call__(self, player_hand, dealer_upcard):
+        upcard = 1 if dealer_upcard == 11 else dealer_upcard
+        index = table_index(self.bucket, upcard, 1 if player_hand.is_soft() else 0,
+                            player_hand.get_value())
+        return self.table.hits[index] == 1
+
+    def __repr__(self):
+        return f"TablePolicy(bucket={self.bucket})"
+
+
+def print_chart(table, bucket=FRESH_BUCKET):
+    """Menampilkan tabel strategi satu bucket (D = draw, S = stand)"""
+    upcards = [value for value in range(2, 11)] + [1]
+    header = "      " + " ".join(f"{'A' if u == 1 else u:>3}" for u in upcards)
+    for soft, title in ((0, "NILAI HARD"), (1, "NILAI SOFT")):
+        print(f"\n{title} (bucket {bucket})")
+        print(header)
+        for total in range(12 if soft else 4, 22):
+            row = []
+            for upcard in upcards:
+                hit, _, _ = table.lookup(bucket, upcard, soft, total)
+                row.append("  D" if hit else "  S")
+            print(f"  {total:>2}  " + " ".join(row))
+
+
+def main():
+    """Fungsi utama untuk membangun dan menampilkan tabel strategi"""
+    parser = argparse.ArgumentParser(description="Solver EV eksak Black Jack")
+    parser.add_argument("--save", help="simpan tabel ke file biner")
+    parser.add_argument("--bucket", type=int, default=FRESH_BUCKET, help="bucket yang ditampilkan")
+    args = parser.parse_args()
+
+    table = StrategyTable.build()
+    print_chart(table, args.bucket)
+    if args.save:
+        table.save(args.save)
+        print(f"\n✓ Tabel strategi disimpan ke {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Persistent high scores for the terminal Dinosaur Game
+Runs are stored in SQLite (WAL mode) with indexes on score and on
+(player, score), so the top-N list and a player's best score are index
+lookups even with millions of rows. Writes go through a background thread
+that commits them in batches, so saving a score never blocks the game loop.
+
+Example:
+    python script.py --player rani
+    python dino_leaderboard.py top --limit 10
+    python dino_leaderboard.py best rani
+    python dino_leaderboard.py bench --runs 1000000
+"""
+
+import argparse
+import queue
+import random
+import sqlite3
+import threading
+import time
+
+LEADERBOARD_FILE = "dino_scores.db"
+BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    ticks INTEGER NOT NULL,
+    seed INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_player_score ON scores (player, score DESC);
+"""
+
+
+def connect(filename):
+    conn = sqlite3.connect(filename, timeout=10, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class Leaderboard:
+    """High-score store; add() only queues, a writer thread commits in batches"""
+    def __init__(self, filename=LEADERBOARD_FILE):
+        self.filename = filename
+        self.conn = connect(filename)
+        self.conn.executescript(SCHEMA)
+        self.pending = queue.SimpleQueue()
+        # Runs the writer thread could not save, reported by close()
+        self.failed = 0
+        self.last_error = None
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def add(self, player, score, ticks, seed=None):
+        """Queue one finished run (returns immediately)"""
+        self.pending.put((player, score, ticks, seed, time.time()))
+
+    def _write_loop(self):
+        conn = connect(self.filename)
+        while True:
+            row = self.pending.get()
+            batch = []
+            # Everything already queued goes into the same transaction
+            while row is not None:
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    row = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                # A failed batch must not stop the thread, or every later run is lost too
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO scores (player, score, ticks, seed, created_at) "
+                            "VALUES (?, ?, ?, ?, ?)", batch)
+                except sqlite3.Error as e:
+                    self.failed += len(batch)
+                    self.last_error = e
+            if row is None:
+                conn.close()
+                return
+
+    def top(self, limit=10):
+        """Best runs of all players: [(player, score, ticks, created_at)]"""
+        return self.conn.execute(
+            "SELECT player, score, ticks, created_at FROM scores "
+            "ORDER BY score DESC LIMIT ?", (limit,)).fetchall()
+
+    def best(self, player):
+        """Highest score of one player (0 if none)"""
+        row = self.conn.execute(
+            "SELECT score FROM scores WHERE player = ? "
+            "ORDER BY score DESC LIMIT 1", (player,)).fetchone()
+        return row[0] if row else 0
+
+    def close(self):
+        """Flush queued runs and close the database"""
+        self.pending.put(None)
+        self.writer.join()
+        self.conn.close()
+        if self.failed:
+            print(f"✗ {self.failed} runs could not be saved to {self.filename}: {self.last_error}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_top(leaderboard, limit=10):
+    rows = leaderboard.top(limit)
+    if not rows:
+        print("No scores yet.")
+        return
+    print(f"{'#':>3}  {'PLAYER':<16} {'SCORE':>8} {'TICKS':>8}  DATE")
+    for rank, (player, score, ticks, created_at) in enumerate(rows, 1):
+        date = time.strftime("%Y-%m-%d %H:%M", time.localtime(created_at))
+        print(f"{rank:>3}  {player:<16} {score:>8} {ticks:>8}  {date}")
+
+
+def bench(filename, runs, players=1000, seed=0):
+    """Insert many random runs, then time the leaderboard queries"""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    with Leaderboard(filename) as leaderboard:
+        for _ in range(runs):
+            score = int(rng.expovariate(1 / 400)) // 10 * 10
+            leaderboard.add(f"player{rng.randrange(players)}", score, score * 6)
+    elapsed = time.perf_counter() - start
+    print(f"Inserted {runs:,} runs in {elapsed:.2f}s ({runs / elapsed:,.0f} runs/sec)")
+
+    with Leaderboard(filename) as leaderboard:
+        for name, query in (("top(10)", lambda: leaderboard.top(10)),
+                            ("best(player)", lambda: leaderboard.best(f"player{rng.randrange(players)}"))):
+            count = 1000
+            start = time.perf_counter()
+            for _ in range(count):
+                query()
+            print(f"{name:<14} {(time.perf_counter() - start) / count * 1e6:8.1f} µs/query")
+
+
+def main():
+    """Show or benchmark the leaderboard from the command line"""
+    parser = argparse.ArgumentParser(description="Dino leaderboard")
+    parser.add_argument("--db", default=LEADERBOARD_FILE, help="leaderboard database")
+    sub = parser.add_subparsers(dest="command", required=True)
+    top_parser = sub.add_parser("top", help="show the best runs")
+    top_parser.add_argument("--limit", type=int, default=10)
+    best_parser = sub.add_parser("best", help="show a player's best score")
+    best_parser.add_argument("player")
+    bench_parser = sub.add_parser("bench", help="insert random runs and time the queries")
+    bench_parser.add_argument("--runs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        bench(args.db, args.runs)
+        return
+
+    with Leaderboard(args.db) as leaderboard:
+        if args.command == "top":
+            print_top(leaderboard, args.limit)
+        else:
+            print(f"{args.player}: {leaderboard.best(args.player)}")
+
+
+if __name__ == "__main__":
+    main()
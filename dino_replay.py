@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Deterministic replays for the terminal Dinosaur Game
+A run is fully described by its RNG seed, screen size and the tick of every
+input event, so a replay file stores only that (plus the final score and tick
+count to check against). Playback re-simulates the run with DinoCore, either
+headless at full speed or rendered in curses at any speed multiplier.
+
+File layout: HEADER, then for each run a RUN record followed by its EVENT
+records; a resize event is followed by a RESIZE record with the new size.
+Runs are appended, so one file can hold a whole corpus.
+
+Example:
+    python script.py --record runs.dnr
+    python dino_replay.py verify runs.dnr
+    python dino_replay.py play runs.dnr --run 3 --speed 4
+    python dino_replay.py record-sim corpus.dnr --games 5000
+"""
+
+import argparse
+import curses
+import os
+import struct
+import time
+
+from script import (EVENT_JUMP, EVENT_RESIZE, DinoCore, DinoGame, TICK_RATE,
+                    jump_when_close)
+
+MAGIC = b"DNRP"
+VERSION = 2  # version 2 added resize events
+
+HEADER = struct.Struct("<4sHH")  # magic, version, event record size
+RUN = struct.Struct("<QHHIII")  # seed, height, width, ticks, score, event count
+EVENT = struct.Struct("<IB")  # tick, event code
+RESIZE = struct.Struct("<HH")  # height, width
+
+
+class Run:
+    """One recorded run"""
+    __slots__ = ('seed', 'height', 'width', 'ticks', 'score', 'events')
+
+    def __init__(self, seed, height, width, ticks, score, events):
+        self.seed = seed
+        self.height = height
+        self.width = width
+        self.ticks = ticks
+        self.score = score
+        # (tick, EVENT_JUMP) or (tick, EVENT_RESIZE, height, width), in tick order
+        self.events = events
+
+
+class ReplayWriter:
+    """Appends runs to a replay file"""
+    def __init__(self, filename):
+        is_new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, 'ab')
+        if is_new:
+            self.file.write(HEADER.pack(MAGIC, VERSION, EVENT.size))
+
+    def write_run(self, seed, height, width, ticks, score, events):
+        data = bytearray(RUN.pack(seed, height, width, ticks, score, len(events)))
+        for event in events:
+            data += EVENT.pack(event[0], event[1])
+            if event[1] == EVENT_RESIZE:
+                data += RESIZE.pack(event[2], event[3])
+        self.file.write(data)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_runs(filename):
+    """Yield every Run in a replay file"""
+    with open(filename, 'rb') as f:
+        data = f.read()
+    magic, version, event_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version > VERSION or event_size != EVENT.size:
+        raise ValueError(f"{filename} is not a Dino replay file (version {VERSION})")
+
+    offset = HEADER.size
+    while offset + RUN.size <= len(data):
+        seed, height, width, ticks, score, count = RUN.unpack_from(data, offset)
+        offset += RUN.size
+        events = []
+        for _ in range(count):
+            event = EVENT.unpack_from(data, offset)
+            offset += EVENT.size
+            if event[1] == EVENT_RESIZE:
+                event += RESIZE.unpack_from(data, offset)
+                offset += RESIZE.size
+            events.append(event)
+        yield Run(seed, height, width, ticks, score, events)
+
+
+def replay(run):
+    """Re-simulate a run headless; returns (score, ticks)"""
+    core = DinoCore(run.height, run.width, run.seed)
+    events = run.events
+    index = 0
+    while not core.game_over and core.frame_count < run.ticks:
+        while index < len(events) and events[index][0] == core.frame_count:
+            event = events[index]
+            if event[1] == EVENT_JUMP:
+                core.jump()
+            elif event[1] == EVENT_RESIZE:
+                core.resize(event[2], event[3])
+            index += 1
+        core.update()
+    return core.score, core.frame_count
+
+
+def record_simulated(filename, games, distance=6, seed=0, max_ticks=100_000,
+                     height=24, width=80):
+    """Record games played by the scripted policy (to build a regression corpus)"""
+    policy = jump_when_close(distance)
+    core = DinoCore(height, width)
+    with ReplayWriter(filename) as writer:
+        for game in range(games):
+            core.reset_game(seed=seed + game)
+            core.game_over = False
+            events = []
+            while not core.game_over and core.frame_count < max_ticks:
+                if policy(core):
+                    events.append((core.frame_count, EVENT_JUMP))
+                    core.jump()
+                core.update()
+            writer.write_run(seed + game, height, width, core.frame_count, core.score, events)
+
+
+class ReplayGame(DinoGame):
+    """DinoGame driven by a recorded run instead of the keyboard"""
+    def __init__(self, stdscr, run, speed=1.0):
+        super().__init__(stdscr)
+        # Re-create the game state with the recorded seed and screen size
+        DinoCore.__init__(self, run.height, run.width, run.seed)
+        self.setup_screen()
+        self.tick_rate = TICK_RATE * speed
+        self.run_data = run
+        self.event_index = 0
+
+    def handle_input(self):
+        """Only Q (stop) and F (frame stats) are read during playback"""
+        for key in self.input.drain():
+            if key == ord('q'):
+                self.game_over = True
+            elif key == ord('f'):
+                self.show_stats = not self.show_stats
+            elif key == curses.KEY_RESIZE:
+                self.setup_screen()
+
+    def update(self):
+        events = self.run_data.events
+        while (self.event_index < len(events) and
+               events[self.event_index][0] == self.frame_count):
+            event = events[self.event_index]
+            if event[1] == EVENT_JUMP:
+                self.jump()
+            elif event[1] == EVENT_RESIZE:
+                self.resize(event[2], event[3])
+                self.setup_screen()
+            self.event_index += 1
+        DinoCore.update(self)
+        if self.frame_count >= self.run_data.ticks:
+            self.game_over = True
+
+    def handle_restart(self):
+        """Keep the last frame on screen until a key is pressed"""
+        return not self.input.drain()
+
+
+def play(stdscr, run, speed):
+    height, width = stdscr.getmaxyx()
+    if height < run.height or width < run.width:
+        stdscr.addstr(0, 0, f"Terminal too small for this replay ({run.height}x{run.width})")
+        stdscr.refresh()
+        stdscr.nodelay(False)
+        stdscr.getch()
+        return
+    game = ReplayGame(stdscr, run, speed)
+    game.run()
+    game.input.close()
+
+
+def verify(filenames):
+    """Replay every run headless and compare with the recorded result"""
+    runs = mismatches = ticks = 0
+    start = time.perf_counter()
+    for filename in filenames:
+        for index, run in enumerate(read_runs(filename)):
+            score, run_ticks = replay(run)
+            runs += 1
+            ticks += run_ticks
+            if (score, run_ticks) != (run.score, run.ticks):
+                mismatches += 1
+                print(f"✗ {filename} run {index}: recorded {run.score} in {run.ticks} ticks, "
+                      f"replayed {score} in {run_ticks} ticks")
+    elapsed = time.perf_counter() - start
+    print(f"Runs: {runs} | Mismatches: {mismatches} | Time: {elapsed:.2f}s "
+          f"({ticks / max(elapsed, 1e-9):,.0f} ticks/sec)")
+    return mismatches == 0
+
+
+def main():
+    """Verify, play back or generate replay files from the command line"""
+    parser = argparse.ArgumentParser(description="Dino replay tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    verify_parser = sub.add_parser("verify", help="replay runs headless and check the results")
+    verify_parser.add_argument("files", nargs="+")
+
+    play_parser = sub.add_parser("play", help="render a recorded run")
+    play_parser.add_argument("file")
+    play_parser.add_argument("--run", type=int, default=0, help="index of the run in the file")
+    play_parser.add_argument("--speed", type=float, default=1.0, help="speed multiplier")
+
+    sim_parser = sub.add_parser("record-sim", help="record games of the scripted policy")
+    sim_parser.add_argument("file")
+    sim_parser.add_argument("--games", type=int, default=1000)
+    sim_parser.add_argument("--seed", type=int, default=0)
+    sim_parser.add_argument("--jump-distance", type=int, default=6)
+    sim_parser.add_argument("--max-ticks", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.command == "verify":
+        raise SystemExit(0 if verify(args.files) else 1)
+
+    if args.command == "record-sim":
+        record_simulated(args.file, args.games, args.jump_distance, args.seed, args.max_ticks)
+        print(f"✓ {args.games} runs recorded to {args.file}")
+        return
+
+    for index, run in enumerate(read_runs(args.file)):
+        if index == args.run:
+            curses.wrapper(play, run, args.speed)
+            print(f"Replayed run {index}: score {run.score} in {run.ticks} ticks")
+            return
+    print(f"✗ {args.file} has no run {args.run}")
+    raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Vectorized Dino environments - N independent games stepped at once with NumPy
+Each game follows the same rules as DinoCore in script.py (jump physics,
+obstacle spawning and movement, scoring, difficulty and collision), but the
+state of all games lives in arrays so a single step advances every game.
+
+The API is gym-like: reset() returns observations, step(actions) returns
+(observations, rewards, dones, info) and finished games are reset
+automatically. This module needs numpy (pip install numpy).
+
+Example:
+    python dino_vec.py --envs 4096 --steps 5000
+    python dino_vec.py --check --games 2000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from script import (DINO_HEIGHT, DINO_WIDTH, OBSTACLE_HEIGHT, OBSTACLE_WIDTH,
+                    jump_when_close, simulate)
+
+GRAVITY = 0.6
+JUMP_VELOCITY = -15
+BASE_SPEED = 3
+MAX_SPEED = 8
+DINO_X = 5
+OBSERVATION_SIZE = 4
+
+
+class DinoVecEnv:
+    """N Dino games played in lockstep.
+
+    Obstacles are kept in a fixed (n, slots) array of x positions with
+    inf marking an empty slot; at most one obstacle spawns per tick, so
+    width / base speed slots are always enough.
+
+    Observations are float32 rows of: height above the ground, vertical
+    velocity, distance to the nearest obstacle ahead (width if none) and
+    current speed. Rewards are the points scored during the step.
+    """
+    def __init__(self, n, height=24, width=80, seed=None, max_ticks=100_000):
+        self.n = n
+        self.height = height
+        self.width = width
+        self.ground_y = height - 3
+        self.max_ticks = max_ticks
+        self.rng = np.random.default_rng(seed)
+        self.slots = width // BASE_SPEED + 2
+        self.rows = np.arange(n)
+
+        self.dino_y = np.zeros(n)
+        self.velocity = np.zeros(n)
+        self.is_jumping = np.zeros(n, dtype=bool)
+        self.obstacle_x = np.full((n, self.slots), np.inf)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.speed = np.zeros(n)
+        self.spawn_rate = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reset all games (or only those where mask is True); returns observations"""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.dino_y[mask] = self.ground_y
+        self.velocity[mask] = 0
+        self.is_jumping[mask] = False
+        self.obstacle_x[mask] = np.inf
+        self.score[mask] = 0
+        self.speed[mask] = BASE_SPEED
+        self.spawn_rate[mask] = 50
+        self.ticks[mask] = 0
+        self.done[mask] = False
+        return self.observe()
+
+    def observe(self):
+        gaps = self.obstacle_x - DINO_X
+        ahead = np.where(gaps >= 0, gaps, np.inf).min(axis=1)
+        obs = np.empty((self.n, OBSERVATION_SIZE), dtype=np.float32)
+        obs[:, 0] = self.ground_y - self.dino_y
+        obs[:, 1] = self.velocity
+        obs[:, 2] = np.minimum(ahead, self.width)
+        obs[:, 3] = self.speed
+        return obs
+
+    def step(self, actions):
+        """Advance every game by one tick.
+
+        actions is an array of n booleans (True = jump). Games that end are
+        reset before returning; info holds their final score and ticks
+        (zero for games still running).
+        """
+        # Jump (only from the ground)
+        start = np.asarray(actions, dtype=bool) & ~self.is_jumping
+        self.is_jumping |= start
+        self.velocity[start] = JUMP_VELOCITY
+        self.ticks += 1
+
+        # Jump physics
+        jumping = self.is_jumping
+        self.velocity += np.where(jumping, GRAVITY, 0)
+        self.dino_y += np.where(jumping, self.velocity, 0)
+        landed = jumping & (self.dino_y >= self.ground_y)
+        self.dino_y[landed] = self.ground_y
+        self.velocity[landed] = 0
+        self.is_jumping &= ~landed
+
+        # Spawn into the first free slot (randint(1, rate) == 1)
+        spawn = self.rng.random(self.n) * self.spawn_rate < 1
+        if spawn.any():
+            free = np.argmax(np.isinf(self.obstacle_x), axis=1)
+            rows = self.rows[spawn]
+            self.obstacle_x[rows, free[spawn]] = self.width
+
+        # Move obstacles; each one that leaves the screen scores 10
+        self.obstacle_x -= self.speed[:, None]
+        expired = self.obstacle_x < 0
+        self.obstacle_x[expired] = np.inf
+        rewards = 10 * np.count_nonzero(expired, axis=1)
+        self.score += rewards
+
+        # Difficulty
+        self.speed = np.minimum(BASE_SPEED + (self.score // 100) * 0.5, MAX_SPEED)
+        self.spawn_rate = np.maximum(20, 50 - self.score // 150)
+
+        # Collision: every obstacle stands on the ground
+        overlap = ((self.obstacle_x > DINO_X - OBSTACLE_WIDTH) &
+                   (self.obstacle_x < DINO_X + DINO_WIDTH)).any(axis=1)
+        low = ((self.dino_y + DINO_HEIGHT > self.ground_y) &
+               (self.dino_y < self.ground_y + OBSTACLE_HEIGHT))
+        self.done = (overlap & low) | (self.ticks >= self.max_ticks)
+
+        info = {
+            "final_score": np.where(self.done, self.score, 0),
+            "final_ticks": np.where(self.done, self.ticks, 0),
+        }
+        dones = self.done.copy()
+        if dones.any():
+            self.reset(dones)
+        return self.observe(), rewards, dones, info
+
+
+def jump_when_close_batch(distance=6):
+    """Vectorized version of script.jump_when_close"""
+    def policy(obs):
+        return obs[:, 2] <= distance
+    return policy
+
+
+def run(envs, steps, policy, seed=0, height=24, width=80):
+    """Step envs games for a number of steps; returns (finished scores, seconds)"""
+    env = DinoVecEnv(envs, height, width, seed)
+    obs = env.reset()
+    scores = []
+    start = time.perf_counter()
+    for _ in range(steps):
+        obs, _, dones, info = env.step(policy(obs))
+        if dones.any():
+            scores.append(info["final_score"][dones])
+    elapsed = time.perf_counter() - start
+    return (np.concatenate(scores) if scores else np.zeros(0, dtype=np.int64)), elapsed
+
+
+def check_against_scalar(games, distance=6, seed=0):
+    """Compares the mean score with script.simulate under the same policy.
+
+    Returns True if the difference is below 4 standard errors.
+    """
+    scalar = np.array([score for score, _ in simulate(games, jump_when_close(distance), seed)])
+    env = DinoVecEnv(games, seed=seed)
+    policy = jump_when_close_batch(distance)
+    obs = env.reset()
+    batch = np.full(games, -1, dtype=np.int64)
+    while (batch < 0).any():
+        obs, _, dones, info = env.step(policy(obs))
+        first = dones & (batch < 0)
+        batch[first] = info["final_score"][first]
+
+    error = np.sqrt(batch.var() / games + scalar.var() / games)
+    z = (batch.mean() - scalar.mean()) / error if error else 0.0
+    print(f"{'':>8} {'batch':>10} {'scalar':>10} {'z':>7}")
+    print(f"{'score':>8} {batch.mean():>10.2f} {scalar.mean():>10.2f} {z:>+7.2f}")
+    return abs(z) < 4
+
+
+def main():
+    """Benchmark or check the vectorized environments from the command line"""
+    parser = argparse.ArgumentParser(description="Vectorized Dino environments")
+    parser.add_argument("--envs", type=int, default=4096, help="games stepped together")
+    parser.add_argument("--steps", type=int, default=2000, help="steps to run")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--jump-distance", type=int, default=6,
+                        help="scripted policy jumps when an obstacle is this close")
+    parser.add_argument("--check", action="store_true", help="compare with the scalar game")
+    parser.add_argument("--games", type=int, default=1000, help="games for --check")
+    args = parser.parse_args()
+
+    if args.check:
+        ok = check_against_scalar(args.games, args.jump_distance, args.seed)
+        print("✓ Same distribution" if ok else "✗ Distributions differ!")
+        raise SystemExit(0 if ok else 1)
+
+    scores, elapsed = run(args.envs, args.steps, jump_when_close_batch(args.jump_distance), args.seed)
+    total = args.envs * args.steps
+    print(f"Envs: {args.envs} | Steps: {total:,} | Time: {elapsed:.2f}s "
+          f"({total / elapsed:,.0f} steps/sec)")
+    if len(scores):
+        print(f"Finished games: {len(scores)} | Mean score: {scores.mean():.1f} | "
+              f"Best: {scores.max()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,42 @@ Press SPACE to jump and avoid obstacles
 """
 
 import curses
+import os
 import random
+import selectors
+import signal
 import time
 import sys
-from threading import Thread
+from array import array
+from collections import deque
 
-class DinoGame:
-    def __init__(self, stdscr):
-        self.stdscr = stdscr
-        self.height, self.width = stdscr.getmaxyx()
+TICK_RATE = 60  # simulation ticks per second
+MAX_CATCH_UP = 5  # ticks simulated per frame before frames are dropped
+EVENT_JUMP = 1  # input event codes stored in replay files
+EVENT_RESIZE = 2
+
+DINO_WIDTH = 3
+DINO_HEIGHT = 2
+OBSTACLE_WIDTH = 2
+OBSTACLE_HEIGHT = 2
+
+
+class Obstacle:
+    """One obstacle on the track"""
+    __slots__ = ('x', 'y', 'type')
+    
+    def __init__(self, x, y, type='spike'):
+        self.x = x
+        self.y = y
+        self.type = type
+
+
+class DinoCore:
+    """Curses-free game state and rules, driven one tick at a time"""
+    def __init__(self, height, width, seed=None):
+        self.height = height
+        self.width = width
+        self.rng = random.Random(seed)
         
         # Game settings
         self.ground_y = self.height - 3
@@ -27,40 +54,20 @@ class DinoGame:
         self.jump_active = False
         self.gravity = 0.6
         self.is_jumping = False
-        self.obstacles = []
+        # Obstacles all move at the same speed and enter at the right edge,
+        # so the deque stays sorted by x: oldest (leftmost) first
+        self.obstacles = deque()
         self.obstacle_spawn_rate = 50
         self.base_speed = 3
         self.current_speed = self.base_speed
         self.max_score = 0
-        
-        # Setup colors
-        curses.curs_set(0)
-        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        
-        self.stdscr.nodelay(True)
-        self.stdscr.timeout(0)
-        
         self.frame_count = 0
-        self.input_thread = Thread(target=self.handle_input, daemon=True)
-        self.input_thread.start()
     
-    def handle_input(self):
-        """Handle keyboard input in a separate thread"""
-        while not self.game_over:
-            try:
-                key = self.stdscr.getch()
-                if key == ord(' '):
-                    if not self.is_jumping:
-                        self.is_jumping = True
-                        self.jump_velocity = -15
-                elif key == ord('q'):
-                    self.game_over = True
-            except:
-                pass
-            time.sleep(0.01)
+    def jump(self):
+        """Start a jump if the dinosaur is on the ground"""
+        if not self.is_jumping:
+            self.is_jumping = True
+            self.jump_velocity = -15
     
     def update_jump(self):
         """Update jump physics"""
@@ -76,33 +83,45 @@ class DinoGame:
     
     def spawn_obstacle(self):
         """Spawn a new obstacle randomly"""
-        if random.randint(1, self.obstacle_spawn_rate) == 1:
-            self.obstacles.append({
-                'x': self.width,
-                'y': self.ground_y,
-                'type': 'spike'
-            })
+        # The same draw as rng.randint(1, rate) == 1 (rejection sampling on
+        # getrandbits), without randint's argument checks on every tick
+        rate = self.obstacle_spawn_rate
+        bits = rate.bit_length()
+        getrandbits = self.rng.getrandbits
+        r = getrandbits(bits)
+        while r >= rate:
+            r = getrandbits(bits)
+        if r == 0:
+            self.obstacles.append(Obstacle(self.width, self.ground_y))
     
     def update_obstacles(self):
         """Update obstacle positions and remove off-screen ones"""
-        for obstacle in self.obstacles[:]:
-            obstacle['x'] -= self.current_speed
-            if obstacle['x'] < 0:
-                self.obstacles.remove(obstacle)
-                self.score += 10
+        speed = self.current_speed
+        for obstacle in self.obstacles:
+            obstacle.x -= speed
+        
+        # Off-screen obstacles are always at the front of the queue
+        obstacles = self.obstacles
+        while obstacles and obstacles[0].x < 0:
+            obstacles.popleft()
+            self.score += 10
     
     def check_collision(self):
-        """Check collision between dinosaur and obstacles"""
-        dino_width = 3
-        dino_height = 2
-        obstacle_width = 2
-        obstacle_height = 2
+        """Check collision between dinosaur and obstacles.
+        
+        Only obstacles overlapping the dinosaur's columns are tested: the
+        sweep skips the few already passed and stops at the first one ahead.
+        """
+        left = self.dino_x - OBSTACLE_WIDTH
+        right = self.dino_x + DINO_WIDTH
         
         for obstacle in self.obstacles:
-            if (self.dino_x + dino_width > obstacle['x'] and
-                self.dino_x < obstacle['x'] + obstacle_width and
-                self.dino_y + dino_height > obstacle['y'] and
-                self.dino_y < obstacle['y'] + obstacle_height):
+            if obstacle.x <= left:
+                continue
+            if obstacle.x >= right:
+                break
+            if (self.dino_y + DINO_HEIGHT > obstacle.y and
+                self.dino_y < obstacle.y + OBSTACLE_HEIGHT):
                 return True
         return False
     
@@ -115,38 +134,513 @@ class DinoGame:
         # Decrease spawn rate (more obstacles)
         self.obstacle_spawn_rate = max(20, 50 - (self.score // 150))
     
+    def reset_game(self, seed=None):
+        """Reset game state (a new seed starts a new obstacle sequence)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.dino_y = self.ground_y
+        self.score = 0
+        self.obstacles.clear()
+        self.is_jumping = False
+        self.jump_velocity = 0
+        self.current_speed = self.base_speed
+        self.obstacle_spawn_rate = 50
+        self.frame_count = 0
+    
+    def resize(self, height, width):
+        """Change the playing field size; the dinosaur and obstacles stay on the ground"""
+        shift = (height - 3) - self.ground_y
+        self.height = height
+        self.width = width
+        self.ground_y += shift
+        self.dino_y += shift
+        # Obstacles past a narrower right edge wait at the edge, so the deque
+        # stays sorted by x (new ones spawn at the new width)
+        for obstacle in self.obstacles:
+            obstacle.x = min(obstacle.x, width)
+            obstacle.y = self.ground_y
+    
+    def update(self):
+        """Update game state"""
+        self.frame_count += 1
+        
+        if self.is_jumping:
+            self.update_jump()
+        self.spawn_obstacle()
+        score = self.score
+        self.update_obstacles()
+        # Speed and spawn rate only depend on the score
+        if self.score != score:
+            self.increase_difficulty()
+        
+        if self.check_collision():
+            if self.score > self.max_score:
+                self.max_score = self.score
+            self.game_over = True
+
+
+def jump_when_close(distance=6):
+    """Simple scripted policy: jump when the nearest obstacle is within distance"""
+    def policy(core):
+        for obstacle in core.obstacles:
+            gap = obstacle.x - core.dino_x
+            if gap > distance:
+                break
+            if gap >= 0:
+                return True
+        return False
+    return policy
+
+
+def simulate(games=1, policy=None, seed=0, max_ticks=100_000, height=24, width=80):
+    """Play games headless as fast as possible; returns a list of (score, ticks)"""
+    if policy is None:
+        policy = jump_when_close()
+    core = DinoCore(height, width, seed)
+    results = []
+    for game in range(games):
+        core.reset_game(seed=seed + game)
+        core.game_over = False
+        while not core.game_over and core.frame_count < max_ticks:
+            if policy(core):
+                core.jump()
+            core.update()
+        results.append((core.score, core.frame_count))
+    return results
+
+
+DINO_SPRITE = (
+    "  ^^",
+    " /--\\",
+    "/    \\",
+)
+OBSTACLE_SPRITE = "/\\"
+
+
+class FrameBuffer:
+    """Off-screen frame that only sends changed cells to curses.
+    
+    Each frame is composed into the back buffer, compared row by row with
+    what is already on the terminal, and only runs of changed cells are
+    written, so the terminal never needs a full clear and repaint.
+    """
+    def __init__(self, stdscr, height, width):
+        self.stdscr = stdscr
+        self.height = height
+        self.width = width
+        self.blank_chars = [' '] * width
+        self.blank_attrs = [0] * width
+        self.front_chars = [list(self.blank_chars) for _ in range(height)]
+        self.front_attrs = [list(self.blank_attrs) for _ in range(height)]
+        self.back_chars = [list(self.blank_chars) for _ in range(height)]
+        self.back_attrs = [list(self.blank_attrs) for _ in range(height)]
+    
+    def clear(self):
+        """Start a new frame"""
+        for y in range(self.height):
+            self.back_chars[y][:] = self.blank_chars
+            self.back_attrs[y][:] = self.blank_attrs
+    
+    def put(self, y, x, text, attr=0):
+        """Write text into the frame, clipped to the screen"""
+        if not 0 <= y < self.height:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[:self.width - x]
+        if not text:
+            return
+        end = x + len(text)
+        self.back_chars[y][x:end] = text
+        self.back_attrs[y][x:end] = [attr] * len(text)
+    
+    def blit(self, y, sprite):
+        """Copy a pre-clipped sprite row (see SpriteCache) into the frame"""
+        if 0 <= y < self.height:
+            x, end, chars, attrs = sprite
+            self.back_chars[y][x:end] = chars
+            self.back_attrs[y][x:end] = attrs
+    
+    def flush(self):
+        """Write the changed cells and refresh the terminal"""
+        for y in range(self.height):
+            chars, attrs = self.back_chars[y], self.back_attrs[y]
+            front_chars, front_attrs = self.front_chars[y], self.front_attrs[y]
+            if chars == front_chars and attrs == front_attrs:
+                continue
+            
+            x = 0
+            while x < self.width:
+                if chars[x] == front_chars[x] and attrs[x] == front_attrs[x]:
+                    x += 1
+                    continue
+                # Extend the run while cells keep changing with the same attribute
+                start, attr = x, attrs[x]
+                while (x < self.width and attrs[x] == attr and
+                       (chars[x] != front_chars[x] or attrs[x] != front_attrs[x])):
+                    x += 1
+                try:
+                    self.stdscr.addstr(y, start, ''.join(chars[start:x]), attr)
+                except curses.error:
+                    pass  # writing the bottom-right cell moves the cursor off screen
+            
+            front_chars[:] = chars
+            front_attrs[:] = attrs
+        self.stdscr.refresh()
+
+
+def clip_sprite(x, text, attr, width):
+    """Sprite row for FrameBuffer.blit: (x, end, chars, attrs) clipped to width"""
+    text = text[:max(0, width - x)]
+    return (x, x + len(text), list(text), [attr] * len(text))
+
+
+class SpriteCache:
+    """Sprite rows clipped in advance for every column of one screen width"""
+    def __init__(self, width, dino_x):
+        dino_attr = curses.color_pair(2)
+        obstacle_attr = curses.color_pair(3)
+        
+        # Obstacles are drawn at int(x) for 0 <= x < width - 1
+        self.obstacle = [clip_sprite(x, OBSTACLE_SPRITE, obstacle_attr, width)
+                         for x in range(max(0, width - 1))]
+        self.dino = tuple((i, clip_sprite(dino_x, line, dino_attr, width))
+                          for i, line in enumerate(DINO_SPRITE)
+                          if dino_x + len(line) < width)
+        self.ground = clip_sprite(0, "=" * width, curses.color_pair(1), width)
+
+
+class FrameStats:
+    """Tick rate, frame-time percentiles and dropped frames for the game loop"""
+    def __init__(self, window=600):
+        self.frame_times = deque(maxlen=window)  # seconds of work per rendered frame
+        self.ticks = 0
+        self.frames = 0
+        self.dropped = 0
+        self.idle = 0.0  # seconds spent blocked on the game over screen
+        self.started = time.perf_counter()
+    
+    def record_frame(self, seconds):
+        self.frames += 1
+        self.frame_times.append(seconds)
+    
+    def percentile(self, p):
+        """Frame time percentile (0-100) in milliseconds"""
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000
+    
+    def rates(self):
+        """(ticks per second, frames per second) while the game was running"""
+        elapsed = max(time.perf_counter() - self.started - self.idle, 1e-9)
+        return self.ticks / elapsed, self.frames / elapsed
+    
+    def summary(self):
+        tick_rate, frame_rate = self.rates()
+        return (f"{tick_rate:.1f} tps  {frame_rate:.1f} fps  "
+                f"frame p50 {self.percentile(50):.2f}ms p99 {self.percentile(99):.2f}ms  "
+                f"dropped {self.dropped}")
+
+
+class PhaseTimes:
+    """Ring buffer of (frame, seconds) samples for one profiled phase"""
+    __slots__ = ('seconds', 'frames', 'size', 'count', 'total')
+    
+    def __init__(self, size):
+        self.seconds = array('d', bytes(8 * size))
+        self.frames = array('L', bytes(array('L').itemsize * size))
+        self.size = size
+        self.count = 0
+        self.total = 0.0
+    
+    def add(self, frame, seconds):
+        index = self.count % self.size
+        self.seconds[index] = seconds
+        self.frames[index] = frame
+        self.count += 1
+        self.total += seconds
+    
+    def samples(self):
+        """Buffered (frame, seconds) pairs, oldest first"""
+        n = min(self.count, self.size)
+        start = self.count - n
+        return [(self.frames[i % self.size], self.seconds[i % self.size])
+                for i in range(start, self.count)]
+
+
+class PhaseProfiler:
+    """Per-phase timings of DinoGame.update() and render().
+    
+    Phases are timed by wrapping the game's methods on the instance, so a
+    game without a profiler pays nothing. Stacks use the folded format
+    ("render;draw_hud") and dump() writes either flamegraph.pl input or,
+    for a .csv file name, one row per buffered sample.
+    """
+    UPDATE_PHASES = ('update_jump', 'spawn_obstacle', 'update_obstacles',
+                     'increase_difficulty', 'check_collision')
+    RENDER_PHASES = ('draw_ground', 'draw_dino', 'draw_obstacles', 'draw_hud',
+                     'draw_game_over')
+    
+    def __init__(self, size=8192):
+        self.size = size
+        self.frame = 0  # rendered frame counter, stamped on every sample
+        self.phases = {}
+    
+    def wrap(self, obj, name, stack):
+        method = getattr(obj, name)
+        times = self.phases.setdefault(stack, PhaseTimes(self.size))
+        clock = time.perf_counter
+        
+        def timed(*args):
+            start = clock()
+            result = method(*args)
+            times.add(self.frame, clock() - start)
+            return result
+        
+        setattr(obj, name, timed)
+    
+    def attach(self, game):
+        for name in self.UPDATE_PHASES:
+            self.wrap(game, name, f"update;{name}")
+        for name in self.RENDER_PHASES:
+            self.wrap(game, name, f"render;{name}")
+        self.wrap(game, 'update', 'update')
+        self.wrap(game, 'render', 'render')
+        self.attach_frame(game.frame)
+    
+    def attach_frame(self, frame):
+        """Time a (new) frame buffer's clear and flush"""
+        self.wrap(frame, 'clear', 'render;clear')
+        self.wrap(frame, 'flush', 'render;flush')
+    
+    def folded(self):
+        """Self time per stack in microseconds, as flamegraph.pl input lines"""
+        lines = []
+        for stack, times in sorted(self.phases.items()):
+            children = sum(other.total for name, other in self.phases.items()
+                           if name.startswith(stack + ';'))
+            micros = int((times.total - children) * 1e6)
+            if micros > 0:
+                lines.append(f"dino;{stack} {micros}")
+        return lines
+    
+    def dump(self, filename):
+        with open(filename, 'w', encoding='utf-8') as f:
+            if filename.endswith('.csv'):
+                f.write("frame,phase,microseconds\n")
+                rows = sorted((frame, stack, seconds) for stack, times in self.phases.items()
+                              for frame, seconds in times.samples())
+                for frame, stack, seconds in rows:
+                    f.write(f"{frame},{stack},{seconds * 1e6:.1f}\n")
+            else:
+                f.write("\n".join(self.folded()) + "\n")
+    
+    def summary(self):
+        """Calls, mean, p99 and max (microseconds) per phase"""
+        lines = [f"{'PHASE':<30} {'CALLS':>8} {'MEAN':>8} {'P99':>8} {'MAX':>8}"]
+        for stack, times in sorted(self.phases.items()):
+            if not times.count:
+                continue
+            ordered = sorted(seconds for _, seconds in times.samples())
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            lines.append(f"{stack:<30} {times.count:>8} {times.total / times.count * 1e6:>8.1f} "
+                         f"{p99 * 1e6:>8.1f} {ordered[-1] * 1e6:>8.1f}")
+        return "\n".join(lines)
+
+
+class InputSource:
+    """Keyboard events from curses, queued for the game loop.
+    
+    Nothing polls the keyboard in the background: the loop blocks in wait()
+    until either a key arrives or the next tick is due, and drains the queue
+    once per tick. Terminal resizes (SIGWINCH) also wake wait() and are
+    queued as KEY_RESIZE.
+    """
+    def __init__(self, stdscr, fd=None):
+        self.stdscr = stdscr
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+        self.events = deque()
+        
+        # The signal wakeup pipe makes a resize interrupt a blocking select()
+        self.resized = False
+        self.wakeup_read, self.wakeup_write = os.pipe()
+        os.set_blocking(self.wakeup_read, False)
+        os.set_blocking(self.wakeup_write, False)
+        self.selector.register(self.wakeup_read, selectors.EVENT_READ)
+        self.previous_wakeup_fd = signal.set_wakeup_fd(self.wakeup_write)
+        self.previous_handler = signal.signal(signal.SIGWINCH, self.on_resize)
+    
+    def on_resize(self, signum, frame):
+        self.resized = True
+    
+    def pump(self):
+        """Move every key curses has buffered into the queue"""
+        if self.resized:
+            self.resized = False
+            size = os.get_terminal_size(self.fd)
+            # resizeterm queues KEY_RESIZE for the next getch()
+            curses.resizeterm(size.lines, size.columns)
+        while True:
+            key = self.stdscr.getch()
+            if key == -1:
+                return
+            self.events.append(key)
+    
+    def wait(self, timeout=None):
+        """Sleep until input is available or timeout (seconds, None = forever)"""
+        if self.selector.select(timeout):
+            try:
+                os.read(self.wakeup_read, 512)
+            except BlockingIOError:
+                pass
+            self.pump()
+    
+    def drain(self):
+        """All keys received since the last call, oldest first"""
+        self.pump()
+        keys = list(self.events)
+        self.events.clear()
+        return keys
+    
+    def unread(self, keys):
+        """Put drained keys back so the next drain() returns them first"""
+        self.events.extendleft(reversed(keys))
+    
+    def close(self):
+        signal.signal(signal.SIGWINCH, self.previous_handler)
+        signal.set_wakeup_fd(self.previous_wakeup_fd)
+        self.selector.close()
+        os.close(self.wakeup_read)
+        os.close(self.wakeup_write)
+
+
+class DinoGame(DinoCore):
+    def __init__(self, stdscr, recorder=None, leaderboard=None, player=None, profiler=None):
+        height, width = stdscr.getmaxyx()
+        super().__init__(height, width)
+        self.stdscr = stdscr
+        self.tick_rate = TICK_RATE
+        
+        # Every run gets an explicit seed so it can be recorded and replayed
+        self.recorder = recorder
+        self.start_run()
+        
+        # High score survives restarts of the program when a leaderboard is used
+        self.leaderboard = leaderboard
+        self.player = player
+        if leaderboard is not None:
+            self.max_score = leaderboard.best(player)
+        
+        # Setup colors
+        curses.curs_set(0)
+        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)
+        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+        curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
+        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+        
+        self.stdscr.nodelay(True)
+        self.stdscr.timeout(0)
+        
+        self.setup_screen()
+        
+        self.stats = FrameStats()
+        self.show_stats = False
+        
+        self.input = InputSource(stdscr)
+        
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.attach(self)
+    
+    def setup_screen(self):
+        """Size the frame buffer and sprite cache to the terminal"""
+        height, width = self.stdscr.getmaxyx()
+        # Frame buffer starts from a blank screen
+        self.stdscr.clear()
+        self.frame = FrameBuffer(self.stdscr, height, width)
+        self.sprites = SpriteCache(min(self.width, width), self.dino_x)
+        self.hud_key = None
+        self.hud_sprite = None
+        if getattr(self, 'profiler', None) is not None:
+            self.profiler.attach_frame(self.frame)
+    
+    def handle_terminal_resize(self):
+        """Follow a terminal resize (KEY_RESIZE)"""
+        height, width = self.stdscr.getmaxyx()
+        if not self.game_over:
+            self.run_events.append((self.frame_count, EVENT_RESIZE, height, width))
+        super().resize(height, width)
+        self.setup_screen()
+    
+    def start_run(self):
+        """Start a new run with a fresh seed and an empty input log"""
+        self.run_seed = random.randrange(1 << 32)
+        self.run_events = []
+        self.run_saved = False
+        self.run_size = (self.height, self.width)
+        self.reset_game(self.run_seed)
+    
+    def finish_run(self):
+        """Save the finished run to the recorder and leaderboard (once)"""
+        if self.run_saved:
+            return
+        if self.recorder is not None:
+            self.recorder.write_run(self.run_seed, *self.run_size,
+                                    self.frame_count, self.score, self.run_events)
+        if self.leaderboard is not None:
+            self.leaderboard.add(self.player, self.score, self.frame_count, self.run_seed)
+        self.run_saved = True
+    
+    def handle_input(self):
+        """Apply the keys received since the last tick"""
+        for key in self.input.drain():
+            if key == ord(' '):
+                # Logged with the tick it applies to so replays match
+                self.run_events.append((self.frame_count, EVENT_JUMP))
+                self.jump()
+            elif key == ord('q'):
+                self.game_over = True
+            elif key == ord('f'):
+                self.show_stats = not self.show_stats
+            elif key == curses.KEY_RESIZE:
+                self.handle_terminal_resize()
+    
     def draw_dino(self):
         """Draw dinosaur character"""
-        dino = [
-            "  ^^",
-            " /--\\",
-            "/    \\",
-        ]
-        
-        for i, line in enumerate(dino):
-            if self.dino_y + i < self.height - 1:
-                if self.dino_x + len(line) < self.width:
-                    self.stdscr.addstr(int(self.dino_y + i), self.dino_x, 
-                                      line, curses.color_pair(2))
+        limit = self.height - 1
+        for i, sprite in self.sprites.dino:
+            if self.dino_y + i < limit:
+                self.frame.blit(int(self.dino_y + i), sprite)
     
     def draw_obstacles(self):
         """Draw obstacles"""
+        sprites = self.sprites.obstacle
         for obstacle in self.obstacles:
-            if 0 <= obstacle['x'] < self.width and 0 <= obstacle['y'] < self.height:
-                if obstacle['x'] + 1 < self.width:
-                    self.stdscr.addstr(obstacle['y'], int(obstacle['x']), 
-                                      "/\\", curses.color_pair(3))
+            if 0 <= obstacle.x < len(sprites):
+                self.frame.blit(obstacle.y, sprites[int(obstacle.x)])
     
     def draw_ground(self):
         """Draw ground line"""
-        ground_line = "=" * self.width
-        self.stdscr.addstr(self.height - 2, 0, ground_line, curses.color_pair(1))
+        self.frame.blit(self.height - 2, self.sprites.ground)
     
     def draw_hud(self):
         """Draw heads-up display (score, speed)"""
-        score_text = f"Score: {self.score}  Speed: {self.current_speed:.1f}x  High: {self.max_score}"
-        if len(score_text) < self.width:
-            self.stdscr.addstr(0, 0, score_text, curses.color_pair(4))
+        # The text only changes when the score, speed or high score does
+        key = (self.score, self.current_speed, self.max_score)
+        if key != self.hud_key:
+            score_text = f"Score: {self.score}  Speed: {self.current_speed:.1f}x  High: {self.max_score}"
+            self.hud_key = key
+            self.hud_sprite = None
+            if len(score_text) < self.frame.width:
+                self.hud_sprite = clip_sprite(0, score_text, curses.color_pair(4), self.frame.width)
+        if self.hud_sprite is not None:
+            self.frame.blit(0, self.hud_sprite)
+        if self.show_stats:
+            self.frame.put(1, 0, self.stats.summary(), curses.color_pair(1))
     
     def draw_game_over(self):
         """Draw game over screen"""
@@ -156,21 +650,21 @@ class DinoGame:
         center_y = self.height // 2
         center_x = (self.width - len(game_over_text)) // 2
         
-        self.stdscr.addstr(center_y, center_x, game_over_text, 
-                          curses.color_pair(3) | curses.A_BOLD)
+        self.frame.put(center_y, center_x, game_over_text, 
+                       curses.color_pair(3) | curses.A_BOLD)
         
         score_text = f"Final Score: {self.score}"
         center_x_score = (self.width - len(score_text)) // 2
-        self.stdscr.addstr(center_y + 2, center_x_score, score_text, 
-                          curses.color_pair(4))
+        self.frame.put(center_y + 2, center_x_score, score_text, 
+                       curses.color_pair(4))
         
         restart_x = (self.width - len(restart_text)) // 2
-        self.stdscr.addstr(center_y + 4, restart_x, restart_text, 
-                          curses.color_pair(1))
+        self.frame.put(center_y + 4, restart_x, restart_text, 
+                       curses.color_pair(1))
     
     def render(self):
-        """Render the game"""
-        self.stdscr.clear()
+        """Render the game (only changed cells reach the terminal)"""
+        self.frame.clear()
         self.draw_ground()
         self.draw_dino()
         self.draw_obstacles()
@@ -179,69 +673,80 @@ class DinoGame:
         if self.game_over:
             self.draw_game_over()
         
-        self.stdscr.refresh()
-    
-    def reset_game(self):
-        """Reset game state"""
-        self.dino_y = self.ground_y
-        self.score = 0
-        self.obstacles = []
-        self.is_jumping = False
-        self.jump_velocity = 0
-        self.current_speed = self.base_speed
-        self.obstacle_spawn_rate = 50
-        self.frame_count = 0
-    
-    def update(self):
-        """Update game state"""
-        self.frame_count += 1
-        
-        self.update_jump()
-        self.spawn_obstacle()
-        self.update_obstacles()
-        self.increase_difficulty()
-        
-        if self.check_collision():
-            if self.score > self.max_score:
-                self.max_score = self.score
-            self.game_over = True
+        self.frame.flush()
     
     def handle_restart(self):
         """Handle restart input"""
-        try:
-            key = self.stdscr.getch()
+        self.finish_run()
+        keys = self.input.drain()
+        for index, key in enumerate(keys):
             if key == ord(' '):
                 self.game_over = False
-                self.reset_game()
+                self.start_run()
+                # Keys typed after the restart belong to the new run
+                self.input.unread(keys[index + 1:])
+                break
             elif key == ord('q'):
                 return False
-        except:
-            pass
+            elif key == ord('f'):
+                self.show_stats = not self.show_stats
+            elif key == curses.KEY_RESIZE:
+                self.handle_terminal_resize()
         return True
     
     def run(self):
-        """Main game loop"""
-        last_time = time.time()
-        frame_delay = 1 / 60  # 60 FPS target
+        """Main game loop with a fixed timestep.
+        
+        The simulation advances exactly tick_rate times per second whatever the
+        render speed. Between ticks the loop blocks on the input source until
+        the next tick deadline, and on the game over screen until a key arrives.
+        """
+        tick = 1 / self.tick_rate
+        next_tick = time.perf_counter()
         
         while True:
-            current_time = time.time()
-            delta_time = current_time - last_time
+            if self.game_over:
+                self.render()
+                waited = time.perf_counter()
+                self.input.wait()
+                self.stats.idle += time.perf_counter() - waited
+                if not self.handle_restart():
+                    return
+                next_tick = time.perf_counter()
+                continue
+            
+            now = time.perf_counter()
             
-            if delta_time >= frame_delay:
+            # Run every tick that is due, but never more than MAX_CATCH_UP
+            steps = 0
+            while now >= next_tick and steps < MAX_CATCH_UP and not self.game_over:
+                self.handle_input()
                 if not self.game_over:
                     self.update()
-                else:
-                    if not self.handle_restart():
-                        break
-                
+                next_tick += tick
+                steps += 1
+            self.stats.ticks += steps
+            
+            # Too far behind (e.g. the process was paused): skip the backlog
+            if now >= next_tick:
+                behind = int((now - next_tick) / tick) + 1
+                self.stats.dropped += behind
+                next_tick += behind * tick
+            
+            if steps:
+                # Frames that had to run extra ticks replaced dropped ones
+                self.stats.dropped += steps - 1
                 self.render()
-                last_time = current_time
-            else:
-                time.sleep(0.001)
+                self.stats.record_frame(time.perf_counter() - now)
+                if self.profiler is not None:
+                    self.profiler.frame += 1
+            
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self.input.wait(delay)
 
 
-def main(stdscr):
+def main(stdscr, recorder=None, leaderboard=None, player=None, profiler=None):
     """Main function to run the game"""
     # Clear screen
     stdscr.clear()
@@ -256,17 +761,81 @@ def main(stdscr):
         stdscr.getch()
         return
     
-    game = DinoGame(stdscr)
+    game = DinoGame(stdscr, recorder, leaderboard, player, profiler)
     game.run()
+    game.input.close()
+    return game
+
+
+def run_simulation(args):
+    """Run headless games from the command line and print a summary"""
+    start = time.perf_counter()
+    results = simulate(args.simulate, jump_when_close(args.jump_distance), args.seed,
+                       args.max_ticks, args.height, args.width)
+    elapsed = time.perf_counter() - start
+    
+    ticks = sum(t for _, t in results)
+    scores = sorted(score for score, _ in results)
+    print(f"Games: {len(results)}  Ticks: {ticks}  ({ticks / elapsed:,.0f} ticks/sec)")
+    print(f"Score min/median/max: {scores[0]} / {scores[len(scores) // 2]} / {scores[-1]}")
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Terminal Dinosaur Game")
+    parser.add_argument("--simulate", type=int, metavar="GAMES",
+                        help="run GAMES headless games with a scripted jump policy")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for --simulate")
+    parser.add_argument("--max-ticks", type=int, default=100_000, help="tick limit per game")
+    parser.add_argument("--jump-distance", type=int, default=6, help="scripted policy jump distance")
+    parser.add_argument("--height", type=int, default=24, help="simulated screen height")
+    parser.add_argument("--width", type=int, default=80, help="simulated screen width")
+    parser.add_argument("--record", metavar="FILE", help="append every run to a replay file")
+    parser.add_argument("--leaderboard", metavar="FILE", default="dino_scores.db",
+                        help="high score database (default dino_scores.db)")
+    parser.add_argument("--no-leaderboard", action="store_true", help="do not save scores")
+    parser.add_argument("--player", help="name on the leaderboard (default: login name)")
+    parser.add_argument("--profile", metavar="FILE", default=os.environ.get("DINO_PROFILE"),
+                        help="write per-phase timings on exit: folded stacks, or CSV for *.csv "
+                             "(default: $DINO_PROFILE)")
+    args = parser.parse_args()
+    
+    if args.simulate:
+        run_simulation(args)
+        sys.exit(0)
+    
+    recorder = None
+    if args.record:
+        from dino_replay import ReplayWriter
+        recorder = ReplayWriter(args.record)
+    leaderboard = None
+    player = None
+    if not args.no_leaderboard:
+        import getpass
+        from dino_leaderboard import Leaderboard
+        leaderboard = Leaderboard(args.leaderboard)
+        player = args.player or getpass.getuser()
+    profiler = PhaseProfiler() if args.profile else None
     try:
-        curses.wrapper(main)
+        game = curses.wrapper(main, recorder, leaderboard, player, profiler)
         print("Game selesai! Terima kasih telah bermain.")
+        if game is not None:
+            print(f"Frame stats: {game.stats.summary()}")
+            if leaderboard is not None:
+                print(f"High score {player}: {game.max_score}")
     except KeyboardInterrupt:
         print("\nGame dihentikan.")
         sys.exit(0)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if leaderboard is not None:
+            leaderboard.close()
+        if profiler is not None:
+            profiler.dump(args.profile)
+            print(profiler.summary())
+            print(f"Phase timings written to {args.profile}")
@@ -1,21 +1,173 @@
 import sqlite3
 import os
+import re
+import sys
+import csv
+import gzip
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 import json
 
 # Database setup
 DATABASE_FILE = "tasks.db"
 
+# Keeps tasks_fts in step with new rows; import_tasks drops it during a bulk
+# load and indexes each chunk with one INSERT ... SELECT instead.
+FTS_INSERT_TRIGGER = '''CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title) VALUES (new.id, new.title);
+    END'''
+
+# Schema migrations, applied in order; PRAGMA user_version stores how many
+# have run, so existing tasks.db files are upgraded in place when opened.
+MIGRATIONS = [
+    # 1: reminder scan (status + deadline range) and the deadline-ordered list
+    '''
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline ON tasks (status, deadline);
+    CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline);
+    ''',
+    # 2: last-change timestamp for incremental exports
+    '''
+    ALTER TABLE tasks ADD COLUMN updated_at TEXT;
+    UPDATE tasks SET updated_at = created_at;
+    CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at);
+    ''',
+    # 3: full-text search over titles, kept in sync with tasks by triggers
+    f'''
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    );
+    INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');
+    {FTS_INSERT_TRIGGER};
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title) VALUES ('delete', old.id, old.title);
+        INSERT INTO tasks_fts (rowid, title) VALUES (new.id, new.title);
+    END;
+    ''',
+]
+
+PRIORITIES = ("Tinggi", "Normal", "Rendah")
+PRIORITY_EMOJI = {"Tinggi": "🔴", "Normal": "🟡", "Rendah": "🟢"}
+IMPORT_CHUNK_SIZE = 10000
+EXPORT_BATCH_SIZE = 5000
+PAGE_SIZE = 20
+SEARCH_LIMIT = 20
+EXPORT_FIELDS = ("id", "title", "deadline", "priority", "status", "created_at", "updated_at")
+
+
+@lru_cache(maxsize=8192)
+def is_valid_deadline(deadline):
+    """Check a YYYY-MM-DD deadline (cached: imported tasks share few distinct dates)"""
+    try:
+        datetime.strptime(deadline, "%Y-%m-%d")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=4096)
+def days_until(deadline, today):
+    """Days from today (a date) until a YYYY-MM-DD deadline, None if invalid"""
+    try:
+        return (datetime.strptime(deadline, "%Y-%m-%d").date() - today).days
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def deadline_info(deadline, today):
+    """Human readable time left until a deadline (cached per deadline and day)"""
+    days_left = days_until(deadline, today)
+    if days_left is None:
+        return "N/A"
+    if days_left < 0:
+        return f"Terlambat {abs(days_left)} hari"
+    if days_left == 0:
+        return "Hari ini!"
+    if days_left == 1:
+        return "Besok!"
+    return f"{days_left} hari lagi"
+
+
+def fts_query(text):
+    """User search text -> FTS5 query: "quoted phrases" match exactly, other words as prefixes"""
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        if phrase.strip():
+            terms.append('"' + phrase.replace('"', '""') + '"')
+        elif word:
+            terms.append('"' + word.replace('"', '""') + '"*')
+    return " ".join(terms)
+
+
+def print_task(task, today):
+    """Print one task row (id, title, deadline, priority, status)"""
+    task_id, title, deadline, priority, status = task
+    status_icon = "✓" if status == "Selesai" else "○"
+    print(f"\n[{task_id}] {status_icon} {title}")
+    print(f"    Deadline: {deadline} ({deadline_info(deadline, today)})")
+    print(f"    Prioritas: {PRIORITY_EMOJI.get(priority, '🟡')} {priority}")
+    print(f"    Status: {status}")
+
+
+def file_format(filename):
+    """(format, gzip?) from a file name such as tasks.csv or tasks.ndjson.gz"""
+    name = filename.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    extension = os.path.splitext(name)[1]
+    if extension == ".csv":
+        return "csv", compressed
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson", compressed
+    return "json", compressed
+
+
+def open_text(filename, mode, compressed):
+    if compressed:
+        return gzip.open(filename, mode + 't', encoding='utf-8', newline='')
+    return open(filename, mode, encoding='utf-8', newline='')
+
+
+def read_task_records(filename):
+    """Yield task dicts from a JSON array, NDJSON (.ndjson/.jsonl) or CSV file (optionally .gz)"""
+    fmt, compressed = file_format(filename)
+    with open_text(filename, 'r', compressed) as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        elif fmt == "ndjson":
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None  # unparseable line: skipped like any other bad record
+        else:
+            records = json.load(f)
+            if not isinstance(records, list):
+                raise ValueError(f"{filename}: file JSON harus berisi daftar (array) tugas")
+            yield from records
+
+
 class TodoApp:
     def __init__(self):
         self.conn = None
         self.cursor = None
+        # (committed, skipped) of the running or last import, also after a failure
+        self.import_progress = (0, 0)
         self.setup_database()
     
     def setup_database(self):
         """Create database and tables if they don't exist"""
         self.conn = sqlite3.connect(DATABASE_FILE)
         self.cursor = self.conn.cursor()
+        self.configure_connection()
         
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
@@ -29,6 +181,31 @@ class TodoApp:
         ''')
         
         self.conn.commit()
+        self.migrate()
+    
+    def configure_connection(self):
+        """Tune SQLite for many small writes and indexed reads"""
+        # WAL lets readers run alongside a writer and makes commits sequential appends;
+        # with synchronous=NORMAL a commit no longer waits for an fsync
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA cache_size=-16000")  # 16 MB page cache
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+    
+    def migrate(self):
+        """Bring the schema up to date using PRAGMA user_version"""
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        for number in range(version, len(MIGRATIONS)):
+            # Each migration and its version bump commit together
+            try:
+                self.conn.executescript(
+                    f"BEGIN; {MIGRATIONS[number]} PRAGMA user_version = {number + 1}; COMMIT;"
+                )
+            except sqlite3.OperationalError as e:
+                # e.g. an SQLite build without FTS5; retried on the next start
+                self.conn.rollback()
+                print(f"✗ Migrasi database ke versi {number + 1} gagal: {e}")
+                break
     
     def add_task(self, title, deadline, priority="Normal"):
         """Add a new task to the database"""
@@ -39,9 +216,9 @@ class TodoApp:
             created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             self.cursor.execute('''
-                INSERT INTO tasks (title, deadline, priority, created_at)
-                VALUES (?, ?, ?, ?)
-            ''', (title, deadline, priority, created_at))
+                INSERT INTO tasks (title, deadline, priority, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (title, deadline, priority, created_at, created_at))
             
             self.conn.commit()
             print(f"✓ Task '{title}' berhasil ditambahkan!")
@@ -53,14 +230,120 @@ class TodoApp:
             print(f"✗ Terjadi kesalahan: {e}")
             return False
     
-    def get_all_tasks(self):
-        """Retrieve all tasks from database"""
-        try:
-            self.cursor.execute('SELECT id, title, deadline, priority, status FROM tasks ORDER BY deadline ASC')
-            return self.cursor.fetchall()
-        except Exception as e:
-            print(f"✗ Terjadi kesalahan saat mengambil data: {e}")
-            return []
+    def import_tasks(self, records, chunk_size=IMPORT_CHUNK_SIZE):
+        """Insert many tasks with executemany, one transaction per chunk.
+        
+        records are dicts with title, deadline and optionally priority and
+        status (the fields written by export_tasks); anything else, or a title
+        or deadline that is not a string, is skipped. Returns (imported, skipped);
+        import_progress holds the same counts if reading the records fails
+        partway, when the chunks before the error are already committed.
+        """
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        imported = skipped = 0
+        self.import_progress = (0, 0)
+        
+        def rows():
+            nonlocal skipped
+            for record in records:
+                if not isinstance(record, dict):
+                    skipped += 1
+                    continue
+                title = record.get("title")
+                deadline = record.get("deadline")
+                if (not isinstance(title, str) or not isinstance(deadline, str) or
+                        not title.strip() or not is_valid_deadline(deadline)):
+                    skipped += 1
+                    continue
+                priority = record.get("priority")
+                status = record.get("status")
+                yield (title.strip(), deadline,
+                       priority if priority in PRIORITIES else "Normal",
+                       "Selesai" if status == "Selesai" else "Belum Selesai",
+                       created_at, created_at)
+        
+        # Per-row FTS inserts through the trigger dominate a bulk load, so the
+        # trigger is dropped for each chunk and the new ids indexed in one go
+        # (DDL is transactional: a failed chunk rolls the trigger back too)
+        has_fts = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'tasks_fts_insert'"
+        ).fetchone() is not None
+        
+        rows = rows()
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            with self.conn:
+                # sqlite3 only opens a transaction implicitly before DML
+                self.cursor.execute("BEGIN")
+                if has_fts:
+                    self.cursor.execute("DROP TRIGGER tasks_fts_insert")
+                    last_id = self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+                self.cursor.executemany('''
+                    INSERT INTO tasks (title, deadline, priority, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', chunk)
+                if has_fts:
+                    self.cursor.execute(
+                        "INSERT INTO tasks_fts (rowid, title) SELECT id, title FROM tasks WHERE id > ?",
+                        (last_id,))
+                    self.cursor.execute(FTS_INSERT_TRIGGER)
+            imported += len(chunk)
+            self.import_progress = (imported, skipped)
+        
+        # Refresh the planner statistics so they follow the table size
+        if imported:
+            self.cursor.execute("ANALYZE tasks")
+            self.conn.commit()
+        return imported, skipped
+    
+    def iter_task_pages(self, status=None, priority=None, deadline_from=None,
+                        deadline_to=None, page_size=PAGE_SIZE):
+        """Yield pages of tasks ordered by deadline, with optional filters.
+        
+        Pages use keyset pagination: each one is a fresh indexed query that
+        starts after the (deadline, id) of the previous page's last row, so a
+        page costs the same wherever it is and only one page is in memory.
+        """
+        conditions = []
+        params = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if priority:
+            conditions.append("priority = ?")
+            params.append(priority)
+        if deadline_from:
+            conditions.append("deadline >= ?")
+            params.append(deadline_from)
+        if deadline_to:
+            conditions.append("deadline <= ?")
+            params.append(deadline_to)
+        
+        last = None
+        while True:
+            where = list(conditions)
+            page_params = list(params)
+            if last is not None:
+                where.append("(deadline, id) > (?, ?)")
+                page_params.extend(last)
+            query = 'SELECT id, title, deadline, priority, status FROM tasks'
+            if where:
+                query += ' WHERE ' + ' AND '.join(where)
+            query += ' ORDER BY deadline ASC, id ASC LIMIT ?'
+            
+            page = self.conn.execute(query, page_params + [page_size]).fetchall()
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            last = (page[-1][2], page[-1][0])
+    
+    def iter_tasks(self, **filters):
+        """Yield tasks one by one (see iter_task_pages for the filters)"""
+        for page in self.iter_task_pages(**filters):
+            yield from page
     
     def check_reminders(self):
         """Check for tasks with deadline within 1 day"""
@@ -80,81 +363,108 @@ class TodoApp:
             print(f"✗ Terjadi kesalahan: {e}")
             return []
     
-    def display_tasks(self):
-        """Display all tasks in a list view"""
-        tasks = self.get_all_tasks()
+    def display_tasks(self, status=None, priority=None, deadline_from=None,
+                      deadline_to=None, page_size=PAGE_SIZE):
+        """Display tasks page by page in a list view"""
+        today = datetime.now().date()
+        shown = 0
+        
+        try:
+            for page in self.iter_task_pages(status, priority, deadline_from,
+                                             deadline_to, page_size):
+                if shown == 0:
+                    print("\n" + "="*80)
+                    print("📋 DAFTAR TUGAS")
+                    print("="*80)
+                
+                for task in page:
+                    print_task(task, today)
+                shown += len(page)
+                
+                if len(page) == page_size:
+                    answer = input(f"\n-- {shown} tugas ditampilkan. [Enter] halaman berikutnya, [q] berhenti: ")
+                    if answer.strip().lower() == 'q':
+                        break
+        except sqlite3.Error as e:
+            print(f"✗ Terjadi kesalahan saat mengambil data: {e}")
+            return
         
-        if not tasks:
+        if shown == 0:
             print("\n📋 Belum ada tugas. Tambahkan tugas baru!\n")
+    
+    def search_tasks(self, text, status=None, priority=None, deadline_from=None,
+                     deadline_to=None, limit=SEARCH_LIMIT):
+        """Full-text search over titles, best matches first (see fts_query)"""
+        query = fts_query(text)
+        if not query:
+            return []
+        
+        # CROSS JOIN makes the FTS index the outer loop, so the planner can't
+        # pick a scan of tasks with one MATCH per row
+        sql = '''
+            SELECT t.id, t.title, t.deadline, t.priority, t.status
+            FROM tasks_fts CROSS JOIN tasks t ON t.id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ?
+        '''
+        params = [query]
+        for column, operator, value in (("status", "=", status), ("priority", "=", priority),
+                                        ("deadline", ">=", deadline_from),
+                                        ("deadline", "<=", deadline_to)):
+            if value:
+                sql += f" AND t.{column} {operator} ?"
+                params.append(value)
+        sql += " ORDER BY tasks_fts.rank LIMIT ?"
+        params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+    
+    def display_search(self, text, limit=SEARCH_LIMIT, **filters):
+        """Display search results"""
+        try:
+            results = self.search_tasks(text, limit=limit, **filters)
+        except sqlite3.Error as e:
+            print(f"✗ Terjadi kesalahan saat mencari: {e}")
             return
         
+        if not results:
+            print(f"\n🔍 Tidak ada tugas yang cocok dengan '{text}'\n")
+            return
+        
+        today = datetime.now().date()
         print("\n" + "="*80)
-        print("📋 DAFTAR TUGAS")
+        print(f"🔍 HASIL PENCARIAN: {text}")
         print("="*80)
-        
-        for task in tasks:
-            task_id, title, deadline, priority, status = task
-            
-            # Calculate days until deadline
-            try:
-                deadline_date = datetime.strptime(deadline, "%Y-%m-%d").date()
-                days_left = (deadline_date - datetime.now().date()).days
-                
-                if days_left < 0:
-                    days_info = f"Terlambat {abs(days_left)} hari"
-                elif days_left == 0:
-                    days_info = "Hari ini!"
-                elif days_left == 1:
-                    days_info = "Besok!"
-                else:
-                    days_info = f"{days_left} hari lagi"
-            except:
-                days_info = "N/A"
-            
-            # Set priority emoji
-            priority_emoji = {
-                "Tinggi": "🔴",
-                "Normal": "🟡",
-                "Rendah": "🟢"
-            }.get(priority, "🟡")
-            
-            # Set status icon
-            status_icon = "✓" if status == "Selesai" else "○"
-            
-            print(f"\n[{task_id}] {status_icon} {title}")
-            print(f"    Deadline: {deadline} ({days_info})")
-            print(f"    Prioritas: {priority_emoji} {priority}")
-            print(f"    Status: {status}")
+        for task in results:
+            print_task(task, today)
     
     def display_reminders(self):
         """Display tasks that need reminders"""
         reminders = self.check_reminders()
         
         if reminders:
+            today = datetime.now().date()
             print("\n" + "🔔 "*20)
             print("⚠️  PENGINGAT: Tugas-tugas yang akan jatuh tempo!")
             print("🔔 "*20)
             
             for reminder_id, title, deadline in reminders:
-                try:
-                    deadline_date = datetime.strptime(deadline, "%Y-%m-%d").date()
-                    days_left = (deadline_date - datetime.now().date()).days
-                    
-                    if days_left < 0:
-                        print(f"❌ Sudah terlambat: {title} (Deadline: {deadline})")
-                    elif days_left == 0:
-                        print(f"⏰ HARI INI: {title} (Deadline: {deadline})")
-                    else:
-                        print(f"⏱️  Sisa {days_left} hari: {title} (Deadline: {deadline})")
-                except:
-                    pass
+                days_left = days_until(deadline, today)
+                if days_left is None:
+                    continue
+                if days_left < 0:
+                    print(f"❌ Sudah terlambat: {title} (Deadline: {deadline})")
+                elif days_left == 0:
+                    print(f"⏰ HARI INI: {title} (Deadline: {deadline})")
+                else:
+                    print(f"⏱️  Sisa {days_left} hari: {title} (Deadline: {deadline})")
             
             print("🔔 "*20 + "\n")
     
     def complete_task(self, task_id):
         """Mark a task as completed"""
         try:
-            self.cursor.execute('UPDATE tasks SET status = ? WHERE id = ?', ("Selesai", task_id))
+            updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.cursor.execute('UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?',
+                                ("Selesai", updated_at, task_id))
             self.conn.commit()
             print(f"✓ Tugas dengan ID {task_id} sudah ditandai selesai!")
             return True
@@ -183,6 +493,9 @@ class TodoApp:
                 self.cursor.execute('UPDATE tasks SET deadline = ? WHERE id = ?', (deadline, task_id))
             if priority:
                 self.cursor.execute('UPDATE tasks SET priority = ? WHERE id = ?', (priority, task_id))
+            if title or deadline or priority:
+                updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.cursor.execute('UPDATE tasks SET updated_at = ? WHERE id = ?', (updated_at, task_id))
             
             self.conn.commit()
             print(f"✓ Tugas dengan ID {task_id} sudah diperbarui!")
@@ -194,25 +507,59 @@ class TodoApp:
             print(f"✗ Terjadi kesalahan: {e}")
             return False
     
-    def export_tasks(self, filename="tasks_export.json"):
-        """Export tasks to JSON file"""
-        try:
-            tasks = self.get_all_tasks()
-            export_data = []
-            
-            for task in tasks:
-                export_data.append({
-                    "id": task[0],
-                    "title": task[1],
-                    "deadline": task[2],
-                    "priority": task[3],
-                    "status": task[4]
-                })
+    def stream_export(self, filename, fmt=None, compress=None, since=None,
+                      batch_size=EXPORT_BATCH_SIZE):
+        """Write tasks to a file batch by batch; returns the number of rows.
+        
+        fmt is "json" (compact array, one task per line), "ndjson" or "csv"
+        and compress gzips the output; both default to what the file name
+        says. With since, only tasks changed at or after that timestamp
+        (YYYY-MM-DD HH:MM:SS) are written. Deleted tasks are not tracked.
+        """
+        name_format, name_compressed = file_format(filename)
+        fmt = fmt or name_format
+        compress = name_compressed if compress is None else compress
+        
+        query = f"SELECT {', '.join(EXPORT_FIELDS)} FROM tasks"
+        params = ()
+        if since:
+            query += " WHERE updated_at >= ?"
+            params = (since,)
+        query += " ORDER BY id"
+        
+        cursor = self.conn.execute(query, params)
+        count = 0
+        with open_text(filename, 'w', compress) as f:
+            if fmt == "csv":
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_FIELDS)
+            elif fmt == "json":
+                f.write("[")
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if fmt == "csv":
+                    writer.writerows(rows)
+                else:
+                    lines = [json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False,
+                                        separators=(',', ':')) for row in rows]
+                    if fmt == "json":
+                        f.write(("\n" if count == 0 else ",\n") + ",\n".join(lines))
+                    else:
+                        f.write("\n".join(lines) + "\n")
+                count += len(rows)
             
-            print(f"✓ Data sudah diekspor ke {filename}")
+            if fmt == "json":
+                f.write("\n]\n")
+        return count
+    
+    def export_tasks(self, filename="tasks_export.json", since=None):
+        """Export tasks to a JSON, NDJSON or CSV file (add .gz to compress)"""
+        try:
+            count = self.stream_export(filename, since=since)
+            print(f"✓ {count} tugas sudah diekspor ke {filename}")
             return True
         except Exception as e:
             print(f"✗ Terjadi kesalahan saat mengekspor: {e}")
@@ -221,9 +568,26 @@ class TodoApp:
     def close(self):
         """Close database connection"""
         if self.conn:
+            self.cursor.execute("PRAGMA optimize")
             self.conn.close()
 
 
+def ask_task_filters():
+    """Ask for optional status, priority and deadline filters"""
+    filters = {}
+    status_choice = input("Status (1. Belum Selesai, 2. Selesai) [semua]: ").strip()
+    filters["status"] = {"1": "Belum Selesai", "2": "Selesai"}.get(status_choice)
+    priority_choice = input("Prioritas (1. Tinggi, 2. Normal, 3. Rendah) [semua]: ").strip()
+    filters["priority"] = {"1": "Tinggi", "2": "Normal", "3": "Rendah"}.get(priority_choice)
+    for key, label in (("deadline_from", "Deadline dari"), ("deadline_to", "Deadline sampai")):
+        value = input(f"{label} (YYYY-MM-DD) [kosong]: ").strip()
+        if value and not is_valid_deadline(value):
+            print("✗ Format deadline tidak valid, filter ini diabaikan")
+            value = None
+        filters[key] = value or None
+    return filters
+
+
 def display_menu():
     """Display main menu"""
     print("\n" + "="*50)
@@ -234,8 +598,9 @@ def display_menu():
     print("3. ✓ Tandai Selesai")
     print("4. 🗑️  Hapus Tugas")
     print("5. ✏️  Edit Tugas")
-    print("6. 📤 Export Tugas (JSON)")
-    print("7. ❌ Keluar")
+    print("6. 📤 Export Tugas (JSON/NDJSON/CSV)")
+    print("7. 🔍 Cari Tugas")
+    print("8. ❌ Keluar")
     print("="*50)
 
 
@@ -250,7 +615,7 @@ def main():
         app.display_reminders()
         
         display_menu()
-        choice = input("Pilih menu (1-7): ").strip()
+        choice = input("Pilih menu (1-8): ").strip()
         
         if choice == "1":
             print("\n" + "-"*50)
@@ -273,7 +638,11 @@ def main():
             app.add_task(title, deadline, priority)
         
         elif choice == "2":
-            app.display_tasks()
+            use_filter = input("Gunakan filter? (y/n) [n]: ").strip().lower()
+            if use_filter == 'y':
+                app.display_tasks(**ask_task_filters())
+            else:
+                app.display_tasks()
         
         elif choice == "3":
             app.display_tasks()
@@ -330,12 +699,22 @@ def main():
                 print("✗ Input tidak valid!")
         
         elif choice == "6":
-            filename = input("Masukkan nama file (default: tasks_export.json): ").strip()
+            filename = input("Masukkan nama file (.json/.ndjson/.csv, tambah .gz untuk kompres) "
+                             "(default: tasks_export.json): ").strip()
             if not filename:
                 filename = "tasks_export.json"
             app.export_tasks(filename)
         
         elif choice == "7":
+            text = input('Kata kunci (gunakan "..." untuk frasa): ').strip()
+            if not text:
+                print("✗ Kata kunci tidak boleh kosong!")
+                continue
+            use_filter = input("Gunakan filter? (y/n) [n]: ").strip().lower()
+            filters = ask_task_filters() if use_filter == 'y' else {}
+            app.display_search(text, **filters)
+        
+        elif choice == "8":
             print("\n👋 Terima kasih telah menggunakan Aplikasi To-Do List!")
             app.close()
             break
@@ -344,5 +723,108 @@ def main():
             print("✗ Pilihan tidak valid! Silakan coba lagi.")
 
 
+def import_file(filename, chunk_size=IMPORT_CHUNK_SIZE):
+    """Import tasks from a file and report the speed"""
+    app = TodoApp()
+    try:
+        start = time.perf_counter()
+        imported, skipped = app.import_tasks(read_task_records(filename), chunk_size)
+        elapsed = time.perf_counter() - start
+    except (OSError, EOFError, ValueError, csv.Error, sqlite3.Error) as e:
+        print(f"✗ Terjadi kesalahan saat mengimpor: {e}")
+        imported, _ = app.import_progress
+        print(f"✗ Impor berhenti: {imported} tugas sudah tersimpan sebelum kesalahan")
+        return False
+    finally:
+        app.close()
+    
+    rate = imported / elapsed if elapsed > 0 else 0
+    print(f"✓ {imported} tugas diimpor dalam {elapsed:.2f} detik ({rate:,.0f} baris/detik)")
+    if skipped:
+        print(f"✗ {skipped} baris dilewati (rusak, bukan objek, judul kosong atau deadline tidak valid)")
+    return True
+
+
+def export_file(filename, fmt=None, compress=None, since=None, since_file=None):
+    """Export tasks from the command line, optionally only the changes since the last run"""
+    if since_file and not since and os.path.exists(since_file):
+        with open(since_file, encoding='utf-8') as f:
+            since = f.read().strip() or None
+    
+    app = TodoApp()
+    try:
+        started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        start = time.perf_counter()
+        count = app.stream_export(filename, fmt, compress, since)
+        elapsed = time.perf_counter() - start
+    except (OSError, sqlite3.Error) as e:
+        print(f"✗ Terjadi kesalahan saat mengekspor: {e}")
+        return False
+    finally:
+        app.close()
+    
+    rate = count / elapsed if elapsed > 0 else 0
+    print(f"✓ {count} tugas diekspor ke {filename} dalam {elapsed:.2f} detik ({rate:,.0f} baris/detik)")
+    # The next incremental export starts when this one did; tasks changed
+    # within that same second are exported again rather than missed
+    if since_file:
+        with open(since_file, 'w', encoding='utf-8') as f:
+            f.write(started_at + "\n")
+    return True
+
+
+def search_from_cli(args):
+    """Search from the command line and report the query time"""
+    app = TodoApp()
+    try:
+        start = time.perf_counter()
+        app.display_search(args.text, args.limit, status=args.status, priority=args.priority,
+                           deadline_from=args.deadline_from, deadline_to=args.deadline_to)
+        print(f"\n({(time.perf_counter() - start) * 1000:.1f} ms)")
+    finally:
+        app.close()
+    return True
+
+
+def cli(argv):
+    """Command line entry point for batch jobs"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Aplikasi To-Do List")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    import_parser = sub.add_parser("import", help="impor tugas dari JSON, NDJSON atau CSV")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE,
+                               help="baris per transaksi")
+    
+    export_parser = sub.add_parser("export", help="ekspor tugas ke JSON, NDJSON atau CSV")
+    export_parser.add_argument("file", help="format dari nama file, misalnya tasks.ndjson.gz")
+    export_parser.add_argument("--format", choices=["json", "ndjson", "csv"])
+    export_parser.add_argument("--gzip", action="store_true", default=None, help="kompres dengan gzip")
+    export_parser.add_argument("--since", metavar="WAKTU",
+                               help="hanya tugas yang berubah sejak YYYY-MM-DD HH:MM:SS")
+    export_parser.add_argument("--since-file", metavar="FILE",
+                               help="baca/simpan waktu perubahan terakhir untuk ekspor bertahap")
+    
+    search_parser = sub.add_parser("search", help="cari tugas berdasarkan judul")
+    search_parser.add_argument("text", help='kata kunci; "..." untuk frasa')
+    search_parser.add_argument("--status", choices=["Belum Selesai", "Selesai"])
+    search_parser.add_argument("--priority", choices=list(PRIORITIES))
+    search_parser.add_argument("--from", dest="deadline_from", metavar="YYYY-MM-DD")
+    search_parser.add_argument("--to", dest="deadline_to", metavar="YYYY-MM-DD")
+    search_parser.add_argument("--limit", type=int, default=SEARCH_LIMIT)
+    
+    args = parser.parse_args(argv)
+    if args.command == "search":
+        return search_from_cli(args)
+    if args.command == "import":
+        return import_file(args.file, args.chunk_size)
+    if args.command == "export":
+        return export_file(args.file, args.format, args.gzip, args.since, args.since_file)
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(0 if cli(sys.argv[1:]) else 1)
     main()